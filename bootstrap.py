@@ -22,11 +22,21 @@ Usage:
 """
 
 import argparse
+import functools
+import gzip
+import hashlib
+import io
+import json
+import shutil
 import sys
 import tempfile
+import tomllib
+import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import Any
+from urllib.parse import urlsplit
 
 # Base URL for raw files
 REPO_OWNER = "endavis"
@@ -53,16 +63,164 @@ SYNC_FILES = [
     "tools/pyproject_template/cleanup.py",
 ]
 
+# Upper bound on concurrent downloads from raw.githubusercontent.com
+MAX_DOWNLOAD_WORKERS = 16
+
+# Read size when streaming a download to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Keys written to the [project] table of settings.toml, in order
+SETTINGS_KEYS = (
+    "project_name",
+    "package_name",
+    "pypi_name",
+    "description",
+    "author_name",
+    "author_email",
+    "github_user",
+    "github_repo",
+)
+
+# Escapes for TOML basic strings, applied in a single str.translate pass
+_TOML_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+# Template state directory, relative to the project root
+SETTINGS_DIR = Path(".config") / "pyproject_template"
+
+# Per-URL ETags from the last --sync, kept in the project's scratch tmp/
+# directory so the machine-local cache is never committed with settings.toml
+ETAG_CACHE_PATH = Path("tmp") / ".sync-etag-cache.json"
+
+
+def fetch_file(url: str, dest: Path, etag: str | None = None) -> tuple[bool, str | None]:
+    """Stream a file from a URL to a local path.
+
+    The body is copied in ``DOWNLOAD_CHUNK_SIZE`` chunks, so memory stays flat
+    regardless of file size. The request advertises gzip so
+    raw.githubusercontent.com can compress the Python sources on the wire; the
+    stream is decompressed on the fly when it does. When ``etag`` is given it
+    is sent as ``If-None-Match``, and a ``304 Not Modified`` reply skips the
+    body transfer entirely.
+
+    Returns:
+        Tuple of (written, ETag). ``written`` is False when the server answered
+        304 and ``dest`` was not touched.
+    """
+    headers = {"Accept-Encoding": "gzip"}
+    if etag:
+        headers["If-None-Match"] = etag
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request) as response:  # nosec B310
+            source: io.BufferedIOBase = response
+            if response.headers.get("Content-Encoding") == "gzip":
+                source = gzip.GzipFile(fileobj=response)
+            with dest.open("wb") as f:
+                shutil.copyfileobj(source, f, DOWNLOAD_CHUNK_SIZE)
+            new_etag = response.headers.get("ETag")
+    except urllib.error.HTTPError as e:
+        if etag and e.code == 304:
+            return False, etag
+        raise
+    return True, new_etag
+
 
 def download_file(url: str, dest: Path) -> None:
     """Download a file from a URL to a local path."""
+    download_files({url: dest})
+
+
+def _sha256(path: Path) -> str:
+    """Return the hex SHA-256 digest of a file."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def download_files(
+    downloads: dict[str, Path], etag_cache: dict[str, dict[str, str]] | None = None
+) -> None:
+    """Download several files concurrently.
+
+    The fetches are network-latency bound, so they run in a thread pool and
+    the whole batch costs roughly one round-trip instead of one per file.
+    Each file streams into a ``.part`` sibling; the parts only replace their
+    destinations once every fetch has succeeded, so a failed download never
+    leaves a partially updated directory behind.
+
+    When ``etag_cache`` is given, a file whose local copy still matches the
+    hash recorded with its ETag is requested conditionally and left in place
+    on ``304 Not Modified``. The cache is updated in place with the new
+    ETags. Locally edited files never match and are always re-downloaded.
+
+    Args:
+        downloads: Mapping of source URL to destination path.
+        etag_cache: Optional mapping of URL to ``{"etag": ..., "sha256": ...}``.
+    """
+
+    def cached_etag(url: str) -> str | None:
+        entry = (etag_cache or {}).get(url)
+        dest = downloads[url]
+        if not entry or not dest.is_file() or _sha256(dest) != entry.get("sha256"):
+            return None
+        return entry.get("etag")
+
+    parts = {url: dest.with_name(f"{dest.name}.part") for url, dest in downloads.items()}
+    etags = {url: cached_etag(url) for url in downloads}
+    workers = max(1, min(MAX_DOWNLOAD_WORKERS, len(downloads)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            url: executor.submit(fetch_file, url, parts[url], etags[url]) for url in downloads
+        }
+
+    results: dict[str, tuple[bool, str | None]] = {}
+    for url, future in futures.items():
+        try:
+            results[url] = future.result()
+        except Exception as e:
+            print(f"Error downloading {url}: {e}")
+            for part in parts.values():
+                part.unlink(missing_ok=True)
+            sys.exit(1)
+
+    for url, dest in downloads.items():
+        written, etag = results[url]
+        if written:
+            parts[url].replace(dest)
+        if etag_cache is None:
+            continue
+        if etag:
+            etag_cache[url] = {"etag": etag, "sha256": _sha256(dest)}
+        else:
+            etag_cache.pop(url, None)
+
+
+def load_etag_cache(project_root: Path) -> dict[str, dict[str, str]]:
+    """Load the download ETag cache, or return an empty one if unreadable."""
     try:
-        with urllib.request.urlopen(url) as response:  # nosec B310
-            content = response.read().decode("utf-8")
-            dest.write_text(content, encoding="utf-8")
-    except Exception as e:
-        print(f"Error downloading {url}: {e}")
-        sys.exit(1)
+        data = json.loads((project_root / ETAG_CACHE_PATH).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {url: entry for url, entry in data.items() if isinstance(entry, dict)}
+
+
+def save_etag_cache(project_root: Path, etag_cache: dict[str, dict[str, str]]) -> None:
+    """Persist the download ETag cache under the project's tmp/ directory."""
+    cache_path = project_root / ETAG_CACHE_PATH
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(json.dumps(etag_cache, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_pyproject_cached(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a pyproject.toml file.
+
+    ``mtime_ns`` and ``size`` are part of the cache key only, so editing the
+    file invalidates the cached result. Callers must not mutate the returned
+    dict because it is shared between calls.
+    """
+    with open(path, "rb") as f:
+        return tomllib.load(f)
 
 
 def detect_project_settings(project_root: Path) -> dict[str, str]:
@@ -76,13 +234,8 @@ def detect_project_settings(project_root: Path) -> dict[str, str]:
         return settings
 
     try:
-        try:
-            import tomllib
-        except ModuleNotFoundError:
-            import tomli as tomllib  # type: ignore[no-redef]
-
-        with pyproject_path.open("rb") as f:
-            data = tomllib.load(f)
+        stat = pyproject_path.stat()
+        data = _parse_pyproject_cached(str(pyproject_path), stat.st_mtime_ns, stat.st_size)
 
         project = data.get("project", {})
 
@@ -106,7 +259,7 @@ def detect_project_settings(project_root: Path) -> dict[str, str]:
 
         repo_url = project.get("urls", {}).get("Repository", "")
         if repo_url:
-            parsed = urlparse(repo_url)
+            parsed = urlsplit(repo_url)
             if parsed.netloc == "github.com" or parsed.netloc.endswith(".github.com"):
                 segments = parsed.path.strip("/").split("/")
                 if len(segments) >= 2:
@@ -124,30 +277,19 @@ def create_settings_file(project_root: Path, settings: dict[str, str]) -> Path:
 
     Returns the path to the created file.
     """
-    settings_dir = project_root / ".config" / "pyproject_template"
+    settings_dir = project_root / SETTINGS_DIR
     settings_dir.mkdir(parents=True, exist_ok=True)
     settings_path = settings_dir / "settings.toml"
 
-    lines = ["[project]"]
-    for key in (
-        "project_name",
-        "package_name",
-        "pypi_name",
-        "description",
-        "author_name",
-        "author_email",
-        "github_user",
-        "github_repo",
-    ):
-        value = settings.get(key, "")
-        escaped = value.replace("\\", "\\\\").replace('"', '\\"')
-        lines.append(f'{key} = "{escaped}"')
-
-    lines.append("")
-    lines.append("[template]")
-    lines.append('commit = ""')
-    lines.append('commit_date = ""')
-    lines.append("")
+    lines = [
+        "[project]",
+        *(f'{key} = "{settings.get(key, "").translate(_TOML_ESCAPE)}"' for key in SETTINGS_KEYS),
+        "",
+        "[template]",
+        'commit = ""',
+        'commit_date = ""',
+        "",
+    ]
 
     settings_path.write_text("\n".join(lines), encoding="utf-8")
     return settings_path
@@ -173,12 +315,14 @@ def run_sync(project_root: Path) -> None:
     pkg_dir.mkdir(parents=True, exist_ok=True)
 
     # Download sync files
+    downloads: dict[str, Path] = {}
     for file_path in SYNC_FILES:
         filename = Path(file_path).name
-        url = f"{BASE_URL}/{file_path}"
-        dest = pkg_dir / filename
         print(f"  Downloading {filename}...")
-        download_file(url, dest)
+        downloads[f"{BASE_URL}/{file_path}"] = pkg_dir / filename
+    etag_cache = load_etag_cache(project_root)
+    download_files(downloads, etag_cache)
+    save_etag_cache(project_root, etag_cache)
 
     print()
 
@@ -226,8 +370,13 @@ def run_sync(project_root: Path) -> None:
     print("  4. Run: python tools/pyproject_template/manage.py sync")
 
 
-def run_setup() -> None:
-    """Run the new project setup wizard (original behavior)."""
+def run_setup(serial: bool = False) -> None:
+    """Run the new project setup wizard (original behavior).
+
+    Args:
+        serial: Configure GitHub settings one step at a time instead of
+            concurrently (useful when debugging API failures).
+    """
     print(f"Bootstrapping {REPO_NAME} setup...")
 
     # Create temp directory
@@ -239,11 +388,12 @@ def run_setup() -> None:
         pkg_dir.mkdir(parents=True, exist_ok=True)
 
         # Download files
+        downloads: dict[str, Path] = {}
         for file_path in SETUP_FILES:
-            url = f"{BASE_URL}/{file_path}"
-            dest = pkg_dir / Path(file_path).name
-            print(f"  Downloading {Path(file_path).name}...")
-            download_file(url, dest)
+            filename = Path(file_path).name
+            print(f"  Downloading {filename}...")
+            downloads[f"{BASE_URL}/{file_path}"] = pkg_dir / filename
+        download_files(downloads)
 
         print("\nStarting setup wizard...\n")
 
@@ -254,7 +404,7 @@ def run_setup() -> None:
         try:
             from tools.pyproject_template.setup_repo import main as setup_main
 
-            setup_main()
+            setup_main(serial=serial)
         except ImportError as e:
             print(f"Error importing setup script: {e}")
             sys.exit(1)
@@ -269,12 +419,19 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         prog="bootstrap.py",
         description="Bootstrap pyproject-template for new or existing projects.",
     )
-    parser.add_argument(
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
         "--sync",
         action="store_true",
         help="Install template management suite for an existing project "
         "(downloads to tools/pyproject_template/)",
     )
+    mode.add_argument(
+        "--serial",
+        action="store_true",
+        help="Apply GitHub repository settings one step at a time instead of concurrently "
+        "(setup mode only)",
+    )
     return parser.parse_args(argv)
 
 
@@ -286,7 +443,7 @@ def main(argv: list[str] | None = None) -> None:
         project_root = Path.cwd()
         run_sync(project_root)
     else:
-        run_setup()
+        run_setup(serial=args.serial)
 
 
 if __name__ == "__main__":
@@ -2,6 +2,14 @@
 
 from __future__ import annotations
 
+import gzip
+import hashlib
+import io
+import json
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+from email.message import Message
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -13,10 +21,41 @@ from bootstrap import (
     create_settings_file,
     detect_project_settings,
     download_file,
+    download_files,
     parse_args,
 )
 
 
+def _make_response(body: bytes, headers: dict[str, str] | None = None) -> MagicMock:
+    """Build a urlopen() context-manager mock that streams ``body`` once."""
+    response = MagicMock()
+    response.read = io.BytesIO(body).read
+    response.headers = headers or {}
+    response.__enter__ = MagicMock(return_value=response)
+    response.__exit__ = MagicMock(return_value=False)
+    return response
+
+
+@pytest.fixture
+def patched_urlopen() -> Iterator[MagicMock]:
+    """Patch urlopen to serve ``# content`` with an ETag for every request.
+
+    A fresh response is built per request because each one streams its body
+    once. Requested URLs are available from the mock's ``call_args_list``.
+    """
+
+    def respond(_request: urllib.request.Request) -> MagicMock:
+        return _make_response(b"# content", {"ETag": '"abc"'})
+
+    with patch("bootstrap.urllib.request.urlopen", side_effect=respond) as mock_urlopen:
+        yield mock_urlopen
+
+
+def _requested_urls(mock_urlopen: MagicMock) -> list[str]:
+    """Return the URLs passed to a patched urlopen, in call order."""
+    return [call.args[0].full_url for call in mock_urlopen.call_args_list]
+
+
 class TestConstants:
     """Tests for file list constants."""
 
@@ -67,6 +106,17 @@ class TestParseArgs:
         args = parse_args(["--sync"])
         assert args.sync is True
 
+    def test_serial_flag(self) -> None:
+        """Test that --serial is parsed and defaults to False."""
+        assert parse_args([]).serial is False
+        assert parse_args(["--serial"]).serial is True
+
+    def test_serial_rejected_with_sync(self) -> None:
+        """Test that --serial cannot be combined with --sync, which ignores it."""
+        with pytest.raises(SystemExit) as exc_info:
+            parse_args(["--sync", "--serial"])
+        assert exc_info.value.code == 2
+
 
 class TestDownloadFile:
     """Tests for download_file function."""
@@ -74,15 +124,28 @@ class TestDownloadFile:
     def test_download_file_writes_content(self, tmp_path: Path) -> None:
         """Test that download_file writes fetched content to disk."""
         dest = tmp_path / "test.py"
-        mock_response = MagicMock()
-        mock_response.read.return_value = b"print('hello')"
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
 
-        with patch("bootstrap.urllib.request.urlopen", return_value=mock_response):
+        def mock_response(_request: urllib.request.Request) -> MagicMock:
+            return _make_response(b"print('hello')")
+
+        with patch("bootstrap.urllib.request.urlopen", side_effect=mock_response):
+            download_file("https://example.com/test.py", dest)
+
+        assert dest.read_text(encoding="utf-8") == "print('hello')"
+
+    def test_download_file_decompresses_gzip(self, tmp_path: Path) -> None:
+        """Test that a gzip-encoded response is decompressed before writing."""
+        dest = tmp_path / "test.py"
+
+        def mock_response(_request: urllib.request.Request) -> MagicMock:
+            return _make_response(gzip.compress(b"print('hello')"), {"Content-Encoding": "gzip"})
+
+        with patch("bootstrap.urllib.request.urlopen", side_effect=mock_response) as mock_urlopen:
             download_file("https://example.com/test.py", dest)
 
         assert dest.read_text(encoding="utf-8") == "print('hello')"
+        request = mock_urlopen.call_args.args[0]
+        assert request.get_header("Accept-encoding") == "gzip"
 
     def test_download_file_exits_on_error(self, tmp_path: Path) -> None:
         """Test that download_file exits on network error."""
@@ -95,6 +158,47 @@ class TestDownloadFile:
             download_file("https://example.com/test.py", dest)
 
 
+class TestDownloadFiles:
+    """Tests for download_files concurrent downloader."""
+
+    def test_writes_each_file(self, tmp_path: Path) -> None:
+        """Test that every URL is fetched and written to its destination."""
+        downloads = {
+            "https://example.com/a.py": tmp_path / "a.py",
+            "https://example.com/b.py": tmp_path / "b.py",
+        }
+
+        def fake_urlopen(request: urllib.request.Request) -> MagicMock:
+            return _make_response(f"# {request.full_url.rsplit('/', 1)[-1]}".encode())
+
+        with patch("bootstrap.urllib.request.urlopen", side_effect=fake_urlopen):
+            download_files(downloads)
+
+        assert (tmp_path / "a.py").read_text(encoding="utf-8") == "# a.py"
+        assert (tmp_path / "b.py").read_text(encoding="utf-8") == "# b.py"
+
+    def test_failure_writes_nothing(self, tmp_path: Path) -> None:
+        """Test that one failed fetch exits before any file is written."""
+        downloads = {
+            "https://example.com/ok.py": tmp_path / "ok.py",
+            "https://example.com/bad.py": tmp_path / "bad.py",
+        }
+
+        def fake_urlopen(request: urllib.request.Request) -> MagicMock:
+            if request.full_url.endswith("bad.py"):
+                raise OSError("Network error")
+            return _make_response(b"# ok")
+
+        with (
+            patch("bootstrap.urllib.request.urlopen", side_effect=fake_urlopen),
+            pytest.raises(SystemExit),
+        ):
+            download_files(downloads)
+
+        assert not (tmp_path / "ok.py").exists()
+        assert not list(tmp_path.glob("*.part"))
+
+
 class TestDetectProjectSettings:
     """Tests for detect_project_settings function."""
 
@@ -212,6 +316,29 @@ class TestDetectProjectSettings:
         assert result["pypi_name"] == "my-project"
         assert result["package_name"] == "my_project"
 
+    def test_reuses_parse_for_unchanged_file(self, tmp_path: Path) -> None:
+        """Test that an unchanged pyproject.toml is parsed only once."""
+        from bootstrap import _parse_pyproject_cached
+
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[project]\nname = "cached"\n', encoding="utf-8")
+
+        detect_project_settings(tmp_path)
+        hits = _parse_pyproject_cached.cache_info().hits
+        result = detect_project_settings(tmp_path)
+
+        assert result["project_name"] == "cached"
+        assert _parse_pyproject_cached.cache_info().hits == hits + 1
+
+    def test_reparses_after_edit(self, tmp_path: Path) -> None:
+        """Test that editing pyproject.toml invalidates the cached parse."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[project]\nname = "before"\n', encoding="utf-8")
+        assert detect_project_settings(tmp_path)["project_name"] == "before"
+
+        pyproject.write_text('[project]\nname = "after-edit"\n', encoding="utf-8")
+        assert detect_project_settings(tmp_path)["project_name"] == "after-edit"
+
 
 class TestCreateSettingsFile:
     """Tests for create_settings_file function."""
@@ -281,46 +408,25 @@ class TestCreateSettingsFile:
 class TestRunSync:
     """Tests for run_sync function."""
 
-    def test_creates_tools_directory(self, tmp_path: Path) -> None:
+    def test_creates_tools_directory(self, tmp_path: Path, patched_urlopen: MagicMock) -> None:
         """Test that tools/pyproject_template/ is created."""
         from bootstrap import run_sync
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = b"# file content"
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
-
-        with (
-            patch("bootstrap.urllib.request.urlopen", return_value=mock_response),
-            patch("subprocess.run") as mock_subprocess,
-        ):
+        with patch("subprocess.run") as mock_subprocess:
             mock_subprocess.return_value = MagicMock(returncode=0, stderr="")
             run_sync(tmp_path)
 
         pkg_dir = tmp_path / "tools" / "pyproject_template"
         assert pkg_dir.exists()
 
-    def test_downloads_all_sync_files(self, tmp_path: Path) -> None:
+    def test_downloads_all_sync_files(self, tmp_path: Path, patched_urlopen: MagicMock) -> None:
         """Test that all SYNC_FILES are downloaded."""
         from bootstrap import run_sync
 
-        downloaded_urls: list[str] = []
-
-        mock_response = MagicMock()
-        mock_response.read.return_value = b"# content"
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
-
-        def track_downloads(url: str) -> MagicMock:
-            downloaded_urls.append(url)
-            return mock_response
-
-        with (
-            patch("bootstrap.urllib.request.urlopen", side_effect=track_downloads),
-            patch("subprocess.run") as mock_subprocess,
-        ):
+        with patch("subprocess.run") as mock_subprocess:
             mock_subprocess.return_value = MagicMock(returncode=0, stderr="")
             run_sync(tmp_path)
+        downloaded_urls = _requested_urls(patched_urlopen)
 
         # Verify each sync file was downloaded
         for file_path in SYNC_FILES:
@@ -346,7 +452,7 @@ class TestRunSync:
 
         assert exc_info.value.code == 0
 
-    def test_overwrites_if_confirmed(self, tmp_path: Path) -> None:
+    def test_overwrites_if_confirmed(self, tmp_path: Path, patched_urlopen: MagicMock) -> None:
         """Test that existing installation is overwritten when confirmed."""
         from bootstrap import run_sync
 
@@ -354,64 +460,98 @@ class TestRunSync:
         pkg_dir.mkdir(parents=True)
         (pkg_dir / "manage.py").write_text("# old", encoding="utf-8")
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = b"# new content"
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
-
         with (
             patch("builtins.input", return_value="y"),
-            patch("bootstrap.urllib.request.urlopen", return_value=mock_response),
             patch("subprocess.run") as mock_subprocess,
         ):
             mock_subprocess.return_value = MagicMock(returncode=0, stderr="")
             run_sync(tmp_path)
 
-        assert (pkg_dir / "manage.py").read_text(encoding="utf-8") == "# new content"
+        assert (pkg_dir / "manage.py").read_text(encoding="utf-8") == "# content"
 
-    def test_creates_settings_file(self, tmp_path: Path) -> None:
+    def test_creates_settings_file(self, tmp_path: Path, patched_urlopen: MagicMock) -> None:
         """Test that settings.toml is created during sync."""
         from bootstrap import run_sync
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = b"# content"
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
-
-        with (
-            patch("bootstrap.urllib.request.urlopen", return_value=mock_response),
-            patch("subprocess.run") as mock_subprocess,
-        ):
+        with patch("subprocess.run") as mock_subprocess:
             mock_subprocess.return_value = MagicMock(returncode=0, stderr="")
             run_sync(tmp_path)
 
         settings_path = tmp_path / ".config" / "pyproject_template" / "settings.toml"
         assert settings_path.exists()
 
+    def test_records_etags(self, tmp_path: Path, patched_urlopen: MagicMock) -> None:
+        """Test that sync stores each file's ETag and content hash."""
+        from bootstrap import ETAG_CACHE_PATH, run_sync
+
+        with patch("subprocess.run") as mock_subprocess:
+            mock_subprocess.return_value = MagicMock(returncode=0, stderr="")
+            run_sync(tmp_path)
+
+        cache = json.loads((tmp_path / ETAG_CACHE_PATH).read_text(encoding="utf-8"))
+        assert len(cache) == len(SYNC_FILES)
+        assert all(entry["etag"] == '"abc"' for entry in cache.values())
+        # The cache stays out of the committed settings directory
+        settings_dir = tmp_path / ".config" / "pyproject_template"
+        assert [p.name for p in settings_dir.iterdir()] == ["settings.toml"]
+
+    def test_resync_keeps_unmodified_files_on_304(self, tmp_path: Path) -> None:
+        """Test that a second sync sends If-None-Match and keeps files on 304."""
+        from bootstrap import download_files
+
+        dest = tmp_path / "utils.py"
+        url = "https://example.com/utils.py"
+        dest.write_text("# cached", encoding="utf-8")
+        cache = {url: {"etag": '"abc"', "sha256": hashlib.sha256(b"# cached").hexdigest()}}
+
+        not_modified = urllib.error.HTTPError(url, 304, "Not Modified", Message(), None)
+        with patch("bootstrap.urllib.request.urlopen", side_effect=not_modified) as mock_urlopen:
+            download_files({url: dest}, cache)
+
+        assert mock_urlopen.call_args.args[0].get_header("If-none-match") == '"abc"'
+        assert dest.read_text(encoding="utf-8") == "# cached"
+        assert cache[url]["etag"] == '"abc"'
+
+    def test_resync_redownloads_locally_edited_files(self, tmp_path: Path) -> None:
+        """Test that a file edited since the last sync is fetched unconditionally."""
+        from bootstrap import download_files
+
+        dest = tmp_path / "utils.py"
+        url = "https://example.com/utils.py"
+        dest.write_text("# edited locally", encoding="utf-8")
+        cache = {url: {"etag": '"abc"', "sha256": hashlib.sha256(b"# cached").hexdigest()}}
+
+        def mock_response(_request: urllib.request.Request) -> MagicMock:
+            return _make_response(b"# upstream", {"ETag": '"abc"'})
+
+        with patch("bootstrap.urllib.request.urlopen", side_effect=mock_response) as mock_urlopen:
+            download_files({url: dest}, cache)
+
+        assert mock_urlopen.call_args.args[0].get_header("If-none-match") is None
+        assert dest.read_text(encoding="utf-8") == "# upstream"
+        assert cache[url]["sha256"] == hashlib.sha256(b"# upstream").hexdigest()
+
+    def test_ignores_corrupt_etag_cache(self, tmp_path: Path) -> None:
+        """Test that an unreadable cache file is treated as empty."""
+        from bootstrap import ETAG_CACHE_PATH, load_etag_cache
+
+        cache_path = tmp_path / ETAG_CACHE_PATH
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_text("not json", encoding="utf-8")
+
+        assert load_etag_cache(tmp_path) == {}
+
 
 class TestRunSetup:
     """Tests for run_setup function (original behavior)."""
 
-    def test_downloads_setup_files_to_temp_dir(self) -> None:
+    def test_downloads_setup_files_to_temp_dir(self, patched_urlopen: MagicMock) -> None:
         """Test that setup mode downloads SETUP_FILES to a temp directory."""
         from bootstrap import run_setup
 
-        downloaded_urls: list[str] = []
-
-        mock_response = MagicMock()
-        mock_response.read.return_value = b"# content"
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
-
-        def track_downloads(url: str) -> MagicMock:
-            downloaded_urls.append(url)
-            return mock_response
-
-        with (
-            patch("bootstrap.urllib.request.urlopen", side_effect=track_downloads),
-            pytest.raises(SystemExit),
-        ):
+        with pytest.raises(SystemExit):
             run_setup()
+        downloaded_urls = _requested_urls(patched_urlopen)
 
         # Verify setup files were downloaded
         for file_path in SETUP_FILES:
@@ -437,4 +577,4 @@ class TestMain:
 
         with patch("bootstrap.run_setup") as mock_setup:
             main([])
-            mock_setup.assert_called_once()
+            mock_setup.assert_called_once_with(serial=False)
@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+import io
+import json
+import urllib.error
+from email.message import Message
 from pathlib import Path
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 
 from tools.pyproject_template.check_template_updates import (
     _emit_coupling_warnings,
     compare_files,
+    get_latest_release,
     load_sync_excludes,
 )
-from tools.pyproject_template.utils import TEMPLATE_OWNED_TEST_FILES
+from tools.pyproject_template.utils import PARALLEL_MIN_FILES, TEMPLATE_OWNED_TEST_FILES
 
 
 def _make_template(
@@ -142,6 +149,21 @@ class TestCompareFilesWithExcludes:
         assert [p.as_posix() for p in diff] == ["src/main.py"]
         assert excluded == []
 
+    def test_skipped_dirs_and_artifacts_not_reported(self, project: Path, template: Path) -> None:
+        template_root = _make_template(
+            template,
+            {
+                ".git/objects/ab/cdef": "x",
+                "docs/.venv/lib/site.py": "x",
+                "src/mod.pyc": "x",
+                "uv.lock": "x",
+                "src/main.py": "y",
+            },
+        )
+        diff, excluded = compare_files(project, template_root, excludes=[])
+        assert [p.as_posix() for p in diff] == ["src/main.py"]
+        assert excluded == []
+
     def test_matching_file_not_reported(self, project: Path, template: Path) -> None:
         # If the project file matches the template, neither bucket should contain it
         # — even if it would otherwise match an exclude pattern.
@@ -161,6 +183,15 @@ class TestCompareFilesWithExcludes:
         assert [p.as_posix() for p in diff] == ["b.py"]
         assert [p.as_posix() for p in excluded] == ["a.py"]
 
+    def test_large_tree_compared_in_parallel(self, project: Path, template: Path) -> None:
+        # Enough files to take the thread-pool path; results must not depend on it.
+        files = {f"docs/page{i:02d}.md": f"page {i}" for i in range(PARALLEL_MIN_FILES)}
+        template_root = _make_template(template, files)
+        _make_template(project, {**files, "docs/page07.md": "edited"}, base=".")
+        diff, excluded = compare_files(project, template_root, excludes=[])
+        assert [p.as_posix() for p in diff] == ["docs/page07.md"]
+        assert excluded == []
+
 
 class TestCompareFilesExcludesTemplateOwnedTests:
     """``compare_files`` silently skips template-owned tooling test files."""
@@ -296,3 +327,46 @@ class TestEmitCouplingWarnings:
         _emit_coupling_warnings(different_files, project)
         captured = capsys.readouterr()
         assert "bootstrap" not in captured.out
+
+
+class _FakeResponse(io.BytesIO):
+    """Minimal ``urlopen`` response carrying a body and an ETag header."""
+
+    def __init__(self, body: dict[str, Any], etag: str) -> None:
+        super().__init__(json.dumps(body).encode())
+        self.headers = Message()
+        self.headers["ETag"] = etag
+
+
+class TestGetLatestRelease:
+    """Tests for the ETag cache in get_latest_release."""
+
+    def test_caches_tag_and_etag(self, tmp_path: Path) -> None:
+        """A 200 response is parsed and its ETag stored for the next call."""
+        cache = tmp_path / ".gh-release-cache.json"
+        response = _FakeResponse({"tag_name": "v2.0.0"}, '"abc"')
+        with patch("urllib.request.urlopen", return_value=response) as urlopen:
+            assert get_latest_release(cache) == "v2.0.0"
+
+        assert urlopen.call_args[0][0].get_header("If-none-match") is None
+        assert json.loads(cache.read_text()) == {"etag": '"abc"', "tag_name": "v2.0.0"}
+
+    def test_not_modified_returns_cached_tag(self, tmp_path: Path) -> None:
+        """A 304 reply to the conditional request returns the cached tag."""
+        cache = tmp_path / ".gh-release-cache.json"
+        cache.write_text(json.dumps({"etag": '"abc"', "tag_name": "v2.0.0"}))
+        not_modified = urllib.error.HTTPError("url", 304, "Not Modified", Message(), None)
+        with patch("urllib.request.urlopen", side_effect=not_modified) as urlopen:
+            assert get_latest_release(cache) == "v2.0.0"
+
+        assert urlopen.call_args[0][0].get_header("If-none-match") == '"abc"'
+
+    def test_corrupt_cache_ignored(self, tmp_path: Path) -> None:
+        """An unreadable cache falls back to an unconditional request."""
+        cache = tmp_path / ".gh-release-cache.json"
+        cache.write_text("not json")
+        response = _FakeResponse({"tag_name": "v2.1.0"}, '"def"')
+        with patch("urllib.request.urlopen", return_value=response) as urlopen:
+            assert get_latest_release(cache) == "v2.1.0"
+
+        assert urlopen.call_args[0][0].get_header("If-none-match") is None
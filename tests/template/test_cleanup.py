@@ -2,20 +2,128 @@
 
 from __future__ import annotations
 
+import shutil
 import subprocess
+from collections import deque
+from collections.abc import Callable
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+from tools.pyproject_template.cleanup import (
+    ALL_TEMPLATE_FILES,
+    SETUP_FILES,
+    CleanupMode,
+    check_stale_template_references,
+    cleanup_template_files,
+    get_dirs_to_delete,
+    get_files_to_delete,
+    main,
+    prompt_cleanup,
+    regenerate_doc_toc,
+    scrub_template_references,
+    update_mkdocs_nav,
+)
+
+# Template files and directories present in a freshly generated project
+_TEMPLATE_TREE_FILES = (
+    "bootstrap.py",
+    "tools/pyproject_template/__init__.py",
+    "tools/pyproject_template/cleanup.py",
+    "tools/pyproject_template/manage.py",
+    "tools/pyproject_template/migrate_existing_project.py",
+    "tools/pyproject_template/setup_repo.py",
+)
+_TEMPLATE_TREE_DIRS = ("docs/template", ".config/pyproject_template")
+
+MKDOCS_WITH_TEMPLATE = """\
+nav:
+  - Home: index.md
+  - Template:
+      - Overview: template/index.md
+      - Manager: template/manage.md
+  - Development:
+      - Setup: development/setup.md
+"""
+MKDOCS_WITHOUT_TEMPLATE = """\
+nav:
+  - Home: index.md
+  - Development:
+      - Setup: development/setup.md
+"""
+MKDOCS_MINIMAL = """\
+nav:
+  - Home: index.md
+  - Template:
+      - Overview: template/index.md
+"""
+_MKDOCS_VARIANTS = {
+    "with_template": MKDOCS_WITH_TEMPLATE,
+    "without_template": MKDOCS_WITHOUT_TEMPLATE,
+    "minimal": MKDOCS_MINIMAL,
+}
+
+
+def _relative_posix(paths: list[Path], root: Path) -> set[str]:
+    """Return ``paths`` as POSIX strings relative to ``root``."""
+    return {path.relative_to(root).as_posix() for path in paths}
+
+
+@pytest.fixture(scope="session")
+def _template_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the template file tree once per session.
+
+    Read-only tests use it directly; tests that delete files take the
+    per-test ``template_tree`` copy instead.
+    """
+    root = tmp_path_factory.mktemp("template_tree")
+    for rel in _TEMPLATE_TREE_DIRS:
+        (root / rel).mkdir(parents=True)
+    for rel in _TEMPLATE_TREE_FILES:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    return root
+
+
+@pytest.fixture(scope="session")
+def _mkdocs_files(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """Write each mkdocs.yml variant once per session."""
+    root = tmp_path_factory.mktemp("mkdocs")
+    files = {}
+    for name, content in _MKDOCS_VARIANTS.items():
+        path = root / f"{name}.yml"
+        path.write_text(content, encoding="utf-8")
+        files[name] = path
+    return files
+
+
+@pytest.fixture
+def install_mkdocs(_mkdocs_files: dict[str, Path]) -> Callable[[str, Path], Path]:
+    """Return a helper that copies a mkdocs.yml variant into a project root.
+
+    Copies (not links) so tests may rewrite the file freely.
+    """
+
+    def install(name: str, root: Path) -> Path:
+        return Path(shutil.copy(_mkdocs_files[name], root / "mkdocs.yml"))
+
+    return install
+
+
+@pytest.fixture
+def template_tree(tmp_path: Path, _template_tree: Path) -> Path:
+    """Return ``tmp_path`` populated with a copy of the template tree."""
+    shutil.copytree(_template_tree, tmp_path, dirs_exist_ok=True)
+    return tmp_path
+
 
 class TestCleanupMode:
     """Tests for CleanupMode enum."""
 
     def test_cleanup_mode_values(self) -> None:
         """Test that CleanupMode has expected values."""
-        from tools.pyproject_template.cleanup import CleanupMode
-
         assert CleanupMode.SETUP_ONLY.value == "setup"
         assert CleanupMode.ALL.value == "all"
 
@@ -23,40 +131,20 @@ class TestCleanupMode:
 class TestGetFilesToDelete:
     """Tests for get_files_to_delete function."""
 
-    def test_get_files_setup_only(self, tmp_path: Path) -> None:
+    def test_get_files_setup_only(self, _template_tree: Path) -> None:
         """Test get_files_to_delete returns setup files for SETUP_ONLY mode."""
-        from tools.pyproject_template.cleanup import CleanupMode, get_files_to_delete
-
-        # Create some setup files
-        (tmp_path / "bootstrap.py").touch()
-        tools_dir = tmp_path / "tools" / "pyproject_template"
-        tools_dir.mkdir(parents=True)
-        (tools_dir / "setup_repo.py").touch()
-        (tools_dir / "migrate_existing_project.py").touch()
-        # This one should NOT be deleted in SETUP_ONLY mode
-        (tools_dir / "manage.py").touch()
-
-        files = get_files_to_delete(CleanupMode.SETUP_ONLY, tmp_path)
+        files = get_files_to_delete(CleanupMode.SETUP_ONLY, _template_tree)
 
         file_names = [f.name for f in files]
         assert "bootstrap.py" in file_names
         assert "setup_repo.py" in file_names
         assert "migrate_existing_project.py" in file_names
+        # manage.py should NOT be deleted in SETUP_ONLY mode
         assert "manage.py" not in file_names
 
-    def test_get_files_all(self, tmp_path: Path) -> None:
+    def test_get_files_all(self, _template_tree: Path) -> None:
         """Test get_files_to_delete returns all template files for ALL mode."""
-        from tools.pyproject_template.cleanup import CleanupMode, get_files_to_delete
-
-        # Create template files
-        (tmp_path / "bootstrap.py").touch()
-        tools_dir = tmp_path / "tools" / "pyproject_template"
-        tools_dir.mkdir(parents=True)
-        (tools_dir / "setup_repo.py").touch()
-        (tools_dir / "manage.py").touch()
-        (tools_dir / "cleanup.py").touch()
-
-        files = get_files_to_delete(CleanupMode.ALL, tmp_path)
+        files = get_files_to_delete(CleanupMode.ALL, _template_tree)
 
         file_names = [f.name for f in files]
         assert "bootstrap.py" in file_names
@@ -66,8 +154,6 @@ class TestGetFilesToDelete:
 
     def test_get_files_nonexistent(self, tmp_path: Path) -> None:
         """Test get_files_to_delete returns empty list when no files exist."""
-        from tools.pyproject_template.cleanup import CleanupMode, get_files_to_delete
-
         files = get_files_to_delete(CleanupMode.SETUP_ONLY, tmp_path)
         assert files == []
 
@@ -75,26 +161,14 @@ class TestGetFilesToDelete:
 class TestGetDirsToDelete:
     """Tests for get_dirs_to_delete function."""
 
-    def test_get_dirs_setup_only(self, tmp_path: Path) -> None:
+    def test_get_dirs_setup_only(self, _template_tree: Path) -> None:
         """Test get_dirs_to_delete returns empty for SETUP_ONLY mode."""
-        from tools.pyproject_template.cleanup import CleanupMode, get_dirs_to_delete
-
-        # Create directories
-        (tmp_path / "tools" / "pyproject_template").mkdir(parents=True)
-
-        dirs = get_dirs_to_delete(CleanupMode.SETUP_ONLY, tmp_path)
+        dirs = get_dirs_to_delete(CleanupMode.SETUP_ONLY, _template_tree)
         assert dirs == []
 
-    def test_get_dirs_all(self, tmp_path: Path) -> None:
+    def test_get_dirs_all(self, _template_tree: Path) -> None:
         """Test get_dirs_to_delete returns directories for ALL mode."""
-        from tools.pyproject_template.cleanup import CleanupMode, get_dirs_to_delete
-
-        # Create directories
-        (tmp_path / "tools" / "pyproject_template").mkdir(parents=True)
-        (tmp_path / "docs" / "template").mkdir(parents=True)
-        (tmp_path / ".config" / "pyproject_template").mkdir(parents=True)
-
-        dirs = get_dirs_to_delete(CleanupMode.ALL, tmp_path)
+        dirs = get_dirs_to_delete(CleanupMode.ALL, _template_tree)
 
         dir_names = [d.name for d in dirs]
         assert "pyproject_template" in dir_names
@@ -103,21 +177,11 @@ class TestGetDirsToDelete:
 class TestUpdateMkdocsNav:
     """Tests for update_mkdocs_nav function."""
 
-    def test_update_mkdocs_nav_removes_template_section(self, tmp_path: Path) -> None:
+    def test_update_mkdocs_nav_removes_template_section(
+        self, tmp_path: Path, install_mkdocs: Callable[[str, Path], Path]
+    ) -> None:
         """Test that Template section is removed from mkdocs.yml."""
-        from tools.pyproject_template.cleanup import update_mkdocs_nav
-
-        mkdocs_content = """\
-nav:
-  - Home: index.md
-  - Template:
-      - Overview: template/index.md
-      - Manager: template/manage.md
-  - Development:
-      - Setup: development/setup.md
-"""
-        mkdocs_file = tmp_path / "mkdocs.yml"
-        mkdocs_file.write_text(mkdocs_content, encoding="utf-8")
+        mkdocs_file = install_mkdocs("with_template", tmp_path)
 
         result = update_mkdocs_nav(tmp_path, dry_run=False)
 
@@ -127,45 +191,28 @@ nav:
         assert "template/index.md" not in new_content
         assert "Development:" in new_content
 
-    def test_update_mkdocs_nav_no_template_section(self, tmp_path: Path) -> None:
+    def test_update_mkdocs_nav_no_template_section(
+        self, tmp_path: Path, install_mkdocs: Callable[[str, Path], Path]
+    ) -> None:
         """Test update_mkdocs_nav when no Template section exists."""
-        from tools.pyproject_template.cleanup import update_mkdocs_nav
-
-        mkdocs_content = """\
-nav:
-  - Home: index.md
-  - Development:
-      - Setup: development/setup.md
-"""
-        mkdocs_file = tmp_path / "mkdocs.yml"
-        mkdocs_file.write_text(mkdocs_content, encoding="utf-8")
+        install_mkdocs("without_template", tmp_path)
 
         result = update_mkdocs_nav(tmp_path, dry_run=False)
         assert result is False
 
-    def test_update_mkdocs_nav_dry_run(self, tmp_path: Path) -> None:
+    def test_update_mkdocs_nav_dry_run(
+        self, tmp_path: Path, install_mkdocs: Callable[[str, Path], Path]
+    ) -> None:
         """Test update_mkdocs_nav dry run doesn't modify file."""
-        from tools.pyproject_template.cleanup import update_mkdocs_nav
-
-        mkdocs_content = """\
-nav:
-  - Home: index.md
-  - Template:
-      - Overview: template/index.md
-"""
-        mkdocs_file = tmp_path / "mkdocs.yml"
-        mkdocs_file.write_text(mkdocs_content, encoding="utf-8")
+        mkdocs_file = install_mkdocs("minimal", tmp_path)
 
         result = update_mkdocs_nav(tmp_path, dry_run=True)
 
         assert result is True
-        # Content should be unchanged
-        assert mkdocs_file.read_text(encoding="utf-8") == mkdocs_content
+        assert mkdocs_file.read_text(encoding="utf-8") == MKDOCS_MINIMAL
 
     def test_update_mkdocs_nav_no_file(self, tmp_path: Path) -> None:
         """Test update_mkdocs_nav when mkdocs.yml doesn't exist."""
-        from tools.pyproject_template.cleanup import update_mkdocs_nav
-
         result = update_mkdocs_nav(tmp_path, dry_run=False)
         assert result is False
 
@@ -173,65 +220,38 @@ nav:
 class TestCleanupTemplateFiles:
     """Tests for cleanup_template_files function."""
 
-    def test_cleanup_setup_only(self, tmp_path: Path) -> None:
+    def test_cleanup_setup_only(self, template_tree: Path) -> None:
         """Test cleanup in SETUP_ONLY mode deletes only setup files."""
-        from tools.pyproject_template.cleanup import (
-            CleanupMode,
-            cleanup_template_files,
-        )
-
-        # Create files
-        (tmp_path / "bootstrap.py").touch()
-        tools_dir = tmp_path / "tools" / "pyproject_template"
-        tools_dir.mkdir(parents=True)
-        (tools_dir / "setup_repo.py").touch()
-        (tools_dir / "manage.py").touch()  # Should NOT be deleted
-
-        result = cleanup_template_files(CleanupMode.SETUP_ONLY, tmp_path)
-
-        assert not (tmp_path / "bootstrap.py").exists()
-        assert not (tools_dir / "setup_repo.py").exists()
-        assert (tools_dir / "manage.py").exists()  # Should still exist
-        assert len(result.deleted_files) >= 2
-        assert len(result.deleted_dirs) == 0
+        result = cleanup_template_files(CleanupMode.SETUP_ONLY, template_tree)
+
+        # Files are only reported after a successful unlink, so check the
+        # result rather than stat()ing every path again
+        assert _relative_posix(result.deleted_files, template_tree) == {
+            "bootstrap.py",
+            "tools/pyproject_template/setup_repo.py",
+            "tools/pyproject_template/migrate_existing_project.py",
+        }
+        assert result.deleted_dirs == []
+        assert result.failed == []
 
-    def test_cleanup_all(self, tmp_path: Path) -> None:
+    def test_cleanup_all(
+        self, template_tree: Path, install_mkdocs: Callable[[str, Path], Path]
+    ) -> None:
         """Test cleanup in ALL mode deletes all template files and directories."""
-        from tools.pyproject_template.cleanup import (
-            CleanupMode,
-            cleanup_template_files,
-        )
-
-        # Create files and directories
-        (tmp_path / "bootstrap.py").touch()
-        tools_dir = tmp_path / "tools" / "pyproject_template"
-        tools_dir.mkdir(parents=True)
-        (tools_dir / "setup_repo.py").touch()
-        (tools_dir / "manage.py").touch()
-        (tools_dir / "__init__.py").touch()
-
-        # Create mkdocs.yml with Template section
-        mkdocs_content = """\
-nav:
-  - Home: index.md
-  - Template:
-      - Overview: template/index.md
-"""
-        (tmp_path / "mkdocs.yml").write_text(mkdocs_content, encoding="utf-8")
+        install_mkdocs("minimal", template_tree)
 
-        result = cleanup_template_files(CleanupMode.ALL, tmp_path)
+        result = cleanup_template_files(CleanupMode.ALL, template_tree)
 
-        assert not (tmp_path / "bootstrap.py").exists()
-        assert not tools_dir.exists()
+        assert _relative_posix(result.deleted_files, template_tree) == set(_TEMPLATE_TREE_FILES)
+        assert _relative_posix(result.deleted_dirs, template_tree) == {
+            "tools/pyproject_template",
+            *_TEMPLATE_TREE_DIRS,
+        }
+        assert result.failed == []
         assert result.mkdocs_updated is True
 
     def test_cleanup_dry_run(self, tmp_path: Path) -> None:
         """Test cleanup dry run doesn't delete files."""
-        from tools.pyproject_template.cleanup import (
-            CleanupMode,
-            cleanup_template_files,
-        )
-
         # Create files
         bootstrap = tmp_path / "bootstrap.py"
         bootstrap.touch()
@@ -245,11 +265,6 @@ nav:
 
     def test_cleanup_no_files(self, tmp_path: Path) -> None:
         """Test cleanup when no template files exist."""
-        from tools.pyproject_template.cleanup import (
-            CleanupMode,
-            cleanup_template_files,
-        )
-
         result = cleanup_template_files(CleanupMode.SETUP_ONLY, tmp_path)
 
         assert result.deleted_files == []
@@ -260,87 +275,64 @@ nav:
 class TestPromptCleanup:
     """Tests for prompt_cleanup function."""
 
-    def test_prompt_cleanup_setup_only(self) -> None:
-        """Test prompt_cleanup returns SETUP_ONLY for choice 1."""
-        from tools.pyproject_template.cleanup import CleanupMode, prompt_cleanup
-
-        with patch("builtins.input", return_value="1"):
-            result = prompt_cleanup()
-            assert result == CleanupMode.SETUP_ONLY
-
-    def test_prompt_cleanup_all(self) -> None:
-        """Test prompt_cleanup returns ALL for choice 2."""
-        from tools.pyproject_template.cleanup import CleanupMode, prompt_cleanup
-
-        with patch("builtins.input", return_value="2"):
-            result = prompt_cleanup()
-            assert result == CleanupMode.ALL
-
-    def test_prompt_cleanup_keep(self) -> None:
-        """Test prompt_cleanup returns None for choice 3."""
-        from tools.pyproject_template.cleanup import prompt_cleanup
-
-        with patch("builtins.input", return_value="3"):
-            result = prompt_cleanup()
-            assert result is None
-
-    def test_prompt_cleanup_invalid_then_valid(self) -> None:
-        """Test prompt_cleanup handles invalid input then valid."""
-        from tools.pyproject_template.cleanup import CleanupMode, prompt_cleanup
-
-        with patch("builtins.input", side_effect=["invalid", "1"]):
-            result = prompt_cleanup()
-            assert result == CleanupMode.SETUP_ONLY
-
-    def test_prompt_cleanup_keyboard_interrupt(self) -> None:
-        """Test prompt_cleanup handles keyboard interrupt."""
-        from tools.pyproject_template.cleanup import prompt_cleanup
-
-        with patch("builtins.input", side_effect=KeyboardInterrupt):
-            result = prompt_cleanup()
-            assert result is None
+    @pytest.mark.parametrize(
+        ("inputs", "expected"),
+        [
+            # Menu choices map to modes; 3 keeps the files
+            (["1"], CleanupMode.SETUP_ONLY),
+            (["2"], CleanupMode.ALL),
+            (["3"], None),
+            # Invalid input re-prompts until a valid choice
+            (["invalid", "1"], CleanupMode.SETUP_ONLY),
+            # Ctrl-C is treated as "keep"
+            (KeyboardInterrupt, None),
+        ],
+    )
+    def test_prompt_cleanup(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        inputs: list[str] | type[KeyboardInterrupt],
+        expected: CleanupMode | None,
+    ) -> None:
+        """Test prompt_cleanup maps each answer sequence to a cleanup mode."""
+        responses = deque(inputs) if isinstance(inputs, list) else None
+
+        def fake_input(_prompt: str = "") -> str:
+            if responses is None:
+                raise KeyboardInterrupt
+            return responses.popleft()
+
+        monkeypatch.setattr("builtins.input", fake_input)
+        assert prompt_cleanup() is expected
 
 
 class TestMain:
     """Tests for main entry point."""
 
-    def test_main_setup_flag(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_main_setup_flag(self, tmp_path: Path) -> None:
         """Test main with --setup flag."""
-        from tools.pyproject_template.cleanup import main
-
-        monkeypatch.chdir(tmp_path)
-
         # Create a file to delete
-        (tmp_path / "bootstrap.py").touch()
+        bootstrap = tmp_path / "bootstrap.py"
+        bootstrap.touch()
 
-        with patch("sys.argv", ["cleanup.py", "--setup"]):
-            result = main()
-            assert result == 0
+        result = main(["--setup"], cwd=tmp_path)
+        assert result == 0
+        assert not bootstrap.exists()
 
-    def test_main_dry_run(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_main_dry_run(self, tmp_path: Path) -> None:
         """Test main with --dry-run flag."""
-        from tools.pyproject_template.cleanup import main
-
-        monkeypatch.chdir(tmp_path)
-
         # Create a file
         bootstrap = tmp_path / "bootstrap.py"
         bootstrap.touch()
 
-        with patch("sys.argv", ["cleanup.py", "--setup", "--dry-run"]):
-            result = main()
-            assert result == 0
-            assert bootstrap.exists()  # Should not be deleted
+        result = main(["--setup", "--dry-run"], cwd=tmp_path)
+        assert result == 0
+        assert bootstrap.exists()  # Should not be deleted
 
-    def test_main_conflicting_flags(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_main_conflicting_flags(self) -> None:
         """Test main with conflicting --setup and --all flags."""
-        from tools.pyproject_template.cleanup import main
-
-        monkeypatch.chdir(tmp_path)
-
-        with patch("sys.argv", ["cleanup.py", "--setup", "--all"]):
-            result = main()
-            assert result == 1
+        # Rejected during argument validation, before anything touches the cwd
+        assert main(["--setup", "--all"]) == 1
 
 
 class TestScrubTemplateReferences:
@@ -647,8 +639,6 @@ git push origin v0.0.0
 
     def test_scrubs_pyproject_when_stanza_present(self, tmp_path: Path) -> None:
         """pyproject.toml stanza is removed when present."""
-        from tools.pyproject_template.cleanup import scrub_template_references
-
         (tmp_path / "pyproject.toml").write_text(self._PYPROJECT_WITH_STANZA, encoding="utf-8")
 
         changed = scrub_template_references(tmp_path)
@@ -661,8 +651,6 @@ git push origin v0.0.0
 
     def test_pyproject_noop_when_stanza_absent(self, tmp_path: Path) -> None:
         """Already-scrubbed pyproject.toml is left unchanged."""
-        from tools.pyproject_template.cleanup import scrub_template_references
-
         pyproject = tmp_path / "pyproject.toml"
         pyproject.write_text(self._PYPROJECT_WITHOUT_STANZA, encoding="utf-8")
 
@@ -673,8 +661,6 @@ git push origin v0.0.0
 
     def test_scrubs_readme_when_sections_present(self, tmp_path: Path) -> None:
         """Both template sections are removed; surrounding headings survive."""
-        from tools.pyproject_template.cleanup import scrub_template_references
-
         readme = tmp_path / "README.md"
         readme.write_text(self._README_WITH_TEMPLATE_SECTIONS, encoding="utf-8")
 
@@ -690,8 +676,6 @@ git push origin v0.0.0
 
     def test_readme_noop_when_sections_absent(self, tmp_path: Path) -> None:
         """Already-scrubbed README.md is left unchanged."""
-        from tools.pyproject_template.cleanup import scrub_template_references
-
         readme = tmp_path / "README.md"
         readme.write_text(self._README_WITHOUT_TEMPLATE_SECTIONS, encoding="utf-8")
 
@@ -702,8 +686,6 @@ git push origin v0.0.0
 
     def test_scrubs_doit_reference_section_and_toc(self, tmp_path: Path) -> None:
         """doit-tasks-reference.md section removed and TOC row rewritten."""
-        from tools.pyproject_template.cleanup import scrub_template_references
-
         doit_ref = tmp_path / "docs" / "development" / "doit-tasks-reference.md"
         doit_ref.parent.mkdir(parents=True)
         doit_ref.write_text(self._DOIT_REF_WITH_TEMPLATE_CLEAN, encoding="utf-8")
@@ -721,8 +703,6 @@ git push origin v0.0.0
 
     def test_doit_reference_noop_when_template_clean_absent(self, tmp_path: Path) -> None:
         """Already-scrubbed doit-tasks-reference.md is left unchanged."""
-        from tools.pyproject_template.cleanup import scrub_template_references
-
         doit_ref = tmp_path / "docs" / "development" / "doit-tasks-reference.md"
         doit_ref.parent.mkdir(parents=True)
         doit_ref.write_text(self._DOIT_REF_WITHOUT_TEMPLATE_CLEAN, encoding="utf-8")
@@ -740,8 +720,6 @@ git push origin v0.0.0
         array entry — the original scrubber only matched the stanza form, so
         the reference survived into spawned projects.
         """
-        from tools.pyproject_template.cleanup import scrub_template_references
-
         pyproject = tmp_path / "pyproject.toml"
         pyproject.write_text(self._PYPROJECT_POST_FMT_WITH_TEMPLATE_REFS, encoding="utf-8")
 
@@ -762,8 +740,6 @@ git push origin v0.0.0
 
     def test_scrubs_pyproject_ruff_perfile_ignores(self, tmp_path: Path) -> None:
         """Ruff ``per-file-ignores`` block for the template path is removed (#469 follow-up)."""
-        from tools.pyproject_template.cleanup import scrub_template_references
-
         pyproject = tmp_path / "pyproject.toml"
         pyproject.write_text(
             'lint.per-file-ignores."tools/pyproject_template/*.py" = [\n'
@@ -785,8 +761,6 @@ git push origin v0.0.0
 
     def test_scrubs_pyproject_mypy_exclude_entry_and_comment(self, tmp_path: Path) -> None:
         """Mypy ``exclude`` entry and its comment go; other excludes stay (#469 follow-up)."""
-        from tools.pyproject_template.cleanup import scrub_template_references
-
         pyproject = tmp_path / "pyproject.toml"
         pyproject.write_text(
             "[tool.mypy]\n"
@@ -815,8 +789,6 @@ git push origin v0.0.0
         preceding ``## Versioning & Releases`` heading and the following
         ``### Creating a Release`` subsection must survive.
         """
-        from tools.pyproject_template.cleanup import scrub_template_references
-
         readme = tmp_path / "README.md"
         readme.write_text(self._README_WITH_TEMPLATE_SUBSECTIONS, encoding="utf-8")
 
@@ -834,8 +806,6 @@ git push origin v0.0.0
 
     def test_scrub_is_idempotent(self, tmp_path: Path) -> None:
         """Running the scrubber twice must change nothing on the second pass."""
-        from tools.pyproject_template.cleanup import scrub_template_references
-
         # Use the realistic post-``fmt_pyproject`` fixture so the idempotency
         # check exercises every new pattern introduced in the #469 follow-up.
         (tmp_path / "pyproject.toml").write_text(
@@ -867,8 +837,6 @@ git push origin v0.0.0
 
     def test_dry_run_does_not_write_files(self, tmp_path: Path) -> None:
         """Under dry_run=True the files are not modified."""
-        from tools.pyproject_template.cleanup import scrub_template_references
-
         pyproject = tmp_path / "pyproject.toml"
         pyproject.write_text(self._PYPROJECT_WITH_STANZA, encoding="utf-8")
 
@@ -881,8 +849,6 @@ git push origin v0.0.0
 
     def test_no_target_files_returns_empty(self, tmp_path: Path) -> None:
         """When none of the three target files exist, return an empty list."""
-        from tools.pyproject_template.cleanup import scrub_template_references
-
         changed = scrub_template_references(tmp_path)
         assert changed == []
 
@@ -894,8 +860,6 @@ git push origin v0.0.0
         (``This page documents...``) must both survive; only the middle
         sentence pointing at deleted ``repo_settings.py`` goes away.
         """
-        from tools.pyproject_template.cleanup import scrub_template_references
-
         github_settings = tmp_path / "docs" / "development" / "github-repository-settings.md"
         github_settings.parent.mkdir(parents=True)
         github_settings.write_text(self._GITHUB_SETTINGS_WITH_TEMPLATE_REFS, encoding="utf-8")
@@ -919,8 +883,6 @@ git push origin v0.0.0
         both survive — the table sits directly under the heading once the
         prose is removed.
         """
-        from tools.pyproject_template.cleanup import scrub_template_references
-
         github_settings = tmp_path / "docs" / "development" / "github-repository-settings.md"
         github_settings.parent.mkdir(parents=True)
         github_settings.write_text(self._GITHUB_SETTINGS_WITH_TEMPLATE_REFS, encoding="utf-8")
@@ -945,8 +907,6 @@ git push origin v0.0.0
         untouched. Only the broken ``configure.py`` link is removed; the
         replacement prose still tells the user the v0.0.0 tag exists.
         """
-        from tools.pyproject_template.cleanup import scrub_template_references
-
         release_auto = tmp_path / "docs" / "development" / "release-and-automation.md"
         release_auto.parent.mkdir(parents=True)
         release_auto.write_text(self._RELEASE_AUTO_WITH_TEMPLATE_REFS, encoding="utf-8")
@@ -969,8 +929,6 @@ git push origin v0.0.0
 
     def test_scrub_idempotent_for_new_targets(self, tmp_path: Path) -> None:
         """Second pass on already-scrubbed new-target files is a no-op (#474)."""
-        from tools.pyproject_template.cleanup import scrub_template_references
-
         github_settings = tmp_path / "docs" / "development" / "github-repository-settings.md"
         github_settings.parent.mkdir(parents=True)
         github_settings.write_text(self._GITHUB_SETTINGS_WITH_TEMPLATE_REFS, encoding="utf-8")
@@ -995,8 +953,6 @@ git push origin v0.0.0
 
     def test_dry_run_does_not_write_new_targets(self, tmp_path: Path) -> None:
         """Under dry_run=True the new-target files are reported but not written (#474)."""
-        from tools.pyproject_template.cleanup import scrub_template_references
-
         github_settings = tmp_path / "docs" / "development" / "github-repository-settings.md"
         github_settings.parent.mkdir(parents=True)
         github_settings.write_text(self._GITHUB_SETTINGS_WITH_TEMPLATE_REFS, encoding="utf-8")
@@ -1026,12 +982,6 @@ class TestCleanupAllDeletesTemplateCleanTask:
 
     def test_cleanup_all_deletes_template_clean_task(self, tmp_path: Path) -> None:
         """template_clean.py is in ALL_TEMPLATE_FILES and gets deleted."""
-        from tools.pyproject_template.cleanup import (
-            ALL_TEMPLATE_FILES,
-            CleanupMode,
-            cleanup_template_files,
-        )
-
         # Verify the constant itself lists the file (documents intent).
         assert "tools/doit/template_clean.py" in ALL_TEMPLATE_FILES
 
@@ -1048,11 +998,6 @@ class TestCleanupAllDeletesTemplateCleanTask:
 
     def test_cleanup_setup_only_leaves_template_clean_task(self, tmp_path: Path) -> None:
         """Under SETUP_ONLY mode, template_clean.py survives (bug-#469 scope)."""
-        from tools.pyproject_template.cleanup import (
-            CleanupMode,
-            cleanup_template_files,
-        )
-
         template_clean = tmp_path / "tools" / "doit" / "template_clean.py"
         template_clean.parent.mkdir(parents=True)
         template_clean.write_text("# placeholder", encoding="utf-8")
@@ -1067,11 +1012,6 @@ class TestCleanupAllInvokesScrubber:
 
     def test_all_mode_scrubs_pyproject(self, tmp_path: Path) -> None:
         """ALL-mode cleanup removes the tools.pyproject_template mypy override."""
-        from tools.pyproject_template.cleanup import (
-            CleanupMode,
-            cleanup_template_files,
-        )
-
         pyproject_content = (
             "[tool.mypy]\n"
             "strict = true\n"
@@ -1098,11 +1038,6 @@ class TestCleanupAllInvokesScrubber:
 
     def test_setup_only_mode_does_not_scrub(self, tmp_path: Path) -> None:
         """SETUP_ONLY mode leaves scrubber targets untouched."""
-        from tools.pyproject_template.cleanup import (
-            CleanupMode,
-            cleanup_template_files,
-        )
-
         pyproject_content = (
             "[[tool.mypy.overrides]]\n"
             "# guarded\n"
@@ -1127,10 +1062,6 @@ class TestCleanupAllInvokesScrubber:
         path leaves both helpers untouched.
         """
         from tools.pyproject_template import cleanup as cleanup_module
-        from tools.pyproject_template.cleanup import (
-            CleanupMode,
-            cleanup_template_files,
-        )
 
         # ALL-mode needs at least one deletable file so the function reaches
         # the post-cleanup helpers.
@@ -1166,8 +1097,6 @@ class TestRegenerateDocToc:
 
     def test_returns_false_when_script_missing(self, tmp_path: Path) -> None:
         """No ``tools/generate_doc_toc.py`` -> return False, no exception."""
-        from tools.pyproject_template.cleanup import regenerate_doc_toc
-
         # Only a TOC; no generator script.
         toc = tmp_path / "docs" / "TABLE_OF_CONTENTS.md"
         toc.parent.mkdir(parents=True)
@@ -1177,8 +1106,6 @@ class TestRegenerateDocToc:
 
     def test_returns_false_when_toc_missing(self, tmp_path: Path) -> None:
         """No ``docs/TABLE_OF_CONTENTS.md`` -> return False."""
-        from tools.pyproject_template.cleanup import regenerate_doc_toc
-
         # Only a script; no TOC.
         script = tmp_path / "tools" / "generate_doc_toc.py"
         script.parent.mkdir(parents=True)
@@ -1188,8 +1115,6 @@ class TestRegenerateDocToc:
 
     def test_invokes_subprocess_and_reports_change(self, tmp_path: Path) -> None:
         """Mocked subprocess: exit 1 -> True, exit 0 -> False, exit 2 -> False (warns)."""
-        from tools.pyproject_template.cleanup import regenerate_doc_toc
-
         # Both files must exist for the function to invoke the subprocess.
         script = tmp_path / "tools" / "generate_doc_toc.py"
         script.parent.mkdir(parents=True)
@@ -1220,8 +1145,6 @@ class TestRegenerateDocToc:
 
     def test_dry_run_does_not_invoke_subprocess(self, tmp_path: Path) -> None:
         """Under dry_run=True the subprocess is NOT invoked; returns True."""
-        from tools.pyproject_template.cleanup import regenerate_doc_toc
-
         script = tmp_path / "tools" / "generate_doc_toc.py"
         script.parent.mkdir(parents=True)
         script.write_text("print('hi')\n", encoding="utf-8")
@@ -1239,8 +1162,6 @@ class TestCheckStaleTemplateReferences:
 
     def test_returns_empty_when_docs_clean(self, tmp_path: Path) -> None:
         """Clean docs tree (no markers) -> empty list."""
-        from tools.pyproject_template.cleanup import check_stale_template_references
-
         clean_doc = tmp_path / "docs" / "guide.md"
         clean_doc.parent.mkdir(parents=True)
         clean_doc.write_text("# Guide\n\nNothing template-y here.\n", encoding="utf-8")
@@ -1249,8 +1170,6 @@ class TestCheckStaleTemplateReferences:
 
     def test_detects_pyproject_template_marker_in_docs(self, tmp_path: Path) -> None:
         """``tools/pyproject_template/`` in a doc -> reported with line number."""
-        from tools.pyproject_template.cleanup import check_stale_template_references
-
         bad_doc = tmp_path / "docs" / "guide.md"
         bad_doc.parent.mkdir(parents=True)
         bad_doc.write_text(
@@ -1267,8 +1186,6 @@ class TestCheckStaleTemplateReferences:
 
     def test_detects_template_tools_reference_marker(self, tmp_path: Path) -> None:
         """``template/tools-reference.md`` in a doc -> reported."""
-        from tools.pyproject_template.cleanup import check_stale_template_references
-
         bad_doc = tmp_path / "docs" / "TABLE_OF_CONTENTS.md"
         bad_doc.parent.mkdir(parents=True)
         bad_doc.write_text(
@@ -1284,8 +1201,6 @@ class TestCheckStaleTemplateReferences:
 
     def test_skips_missing_docs_directory(self, tmp_path: Path) -> None:
         """No ``docs/`` directory -> empty list (and README still scanned if present)."""
-        from tools.pyproject_template.cleanup import check_stale_template_references
-
         # No docs/ at all.
         assert check_stale_template_references(tmp_path) == []
 
@@ -1296,8 +1211,6 @@ class TestCheckStaleTemplateReferences:
 
     def test_scans_readme_at_root(self, tmp_path: Path) -> None:
         """``README.md`` with a marker is reported."""
-        from tools.pyproject_template.cleanup import check_stale_template_references
-
         readme = tmp_path / "README.md"
         readme.write_text(
             "# Project\n\nRun `tools/doit/template_clean.py --setup` to clean up.\n",
@@ -1322,7 +1235,6 @@ class TestSetupFilesIncludesTemplateOwnedTests:
 
     def test_setup_files_contains_all_template_owned_test_files(self) -> None:
         """Every path in TEMPLATE_OWNED_TEST_FILES is present in SETUP_FILES."""
-        from tools.pyproject_template.cleanup import SETUP_FILES
         from tools.pyproject_template.utils import TEMPLATE_OWNED_TEST_FILES
 
         missing = [p for p in TEMPLATE_OWNED_TEST_FILES if p not in SETUP_FILES]
@@ -1333,7 +1245,6 @@ class TestSetupFilesIncludesTemplateOwnedTests:
 
     def test_setup_only_cleanup_targets_include_owned_tests(self, tmp_path: Path) -> None:
         """``get_files_to_delete`` for SETUP_ONLY lists template-owned tests when present."""
-        from tools.pyproject_template.cleanup import CleanupMode, get_files_to_delete
         from tools.pyproject_template.utils import TEMPLATE_OWNED_TEST_FILES
 
         # Create one of the owned test files on disk so get_files_to_delete can find it.
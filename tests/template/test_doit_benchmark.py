@@ -1,64 +1,79 @@
 """Tests for benchmark.py doit tasks."""
 
+from typing import Any
+
+import pytest
+
 from tools.doit.benchmark import task_benchmark, task_benchmark_compare, task_benchmark_save
 
+# Command-line tokens each task's action must contain
+BENCHMARK_FLAGS = frozenset({"--benchmark-enable", "--benchmark-only", "tests/benchmarks/"})
+SAVE_FLAGS = BENCHMARK_FLAGS | {"--benchmark-save=baseline", "--benchmark-storage=tmp/benchmarks"}
+COMPARE_FLAGS = BENCHMARK_FLAGS | {
+    "--benchmark-compare=0001_baseline",
+    "--benchmark-storage=tmp/benchmarks",
+}
+
+
+# Task creators are pure, so each task dict is built once per module
+@pytest.fixture(scope="module")
+def benchmark_task() -> dict[str, Any]:
+    """Return the task_benchmark task dict."""
+    return task_benchmark()
+
+
+@pytest.fixture(scope="module")
+def benchmark_save_task() -> dict[str, Any]:
+    """Return the task_benchmark_save task dict."""
+    return task_benchmark_save()
+
+
+@pytest.fixture(scope="module")
+def benchmark_compare_task() -> dict[str, Any]:
+    """Return the task_benchmark_compare task dict."""
+    return task_benchmark_compare()
+
 
 class TestTaskBenchmark:
     """Tests for task_benchmark function."""
 
-    def test_returns_valid_doit_task(self) -> None:
+    def test_returns_valid_doit_task(self, benchmark_task: dict[str, Any]) -> None:
         """Test that task_benchmark returns a valid doit task dict."""
-        result = task_benchmark()
-        assert isinstance(result, dict)
-        assert "actions" in result
-        assert "title" in result
+        assert isinstance(benchmark_task, dict)
+        assert "actions" in benchmark_task
+        assert "title" in benchmark_task
 
-    def test_actions_contain_benchmark_flags(self) -> None:
+    def test_actions_contain_benchmark_flags(self, benchmark_task: dict[str, Any]) -> None:
         """Test that actions include benchmark-specific flags."""
-        result = task_benchmark()
-        action = result["actions"][0]
-        assert "--benchmark-enable" in action
-        assert "--benchmark-only" in action
-        assert "tests/benchmarks/" in action
+        tokens = set(benchmark_task["actions"][0].split())
+        assert not BENCHMARK_FLAGS - tokens
 
 
 class TestTaskBenchmarkSave:
     """Tests for task_benchmark_save function."""
 
-    def test_returns_valid_doit_task(self) -> None:
+    def test_returns_valid_doit_task(self, benchmark_save_task: dict[str, Any]) -> None:
         """Test that task_benchmark_save returns a valid doit task dict."""
-        result = task_benchmark_save()
-        assert isinstance(result, dict)
-        assert "actions" in result
-        assert "title" in result
+        assert isinstance(benchmark_save_task, dict)
+        assert "actions" in benchmark_save_task
+        assert "title" in benchmark_save_task
 
-    def test_actions_contain_save_flags(self) -> None:
+    def test_actions_contain_save_flags(self, benchmark_save_task: dict[str, Any]) -> None:
         """Test that actions include save-specific flags."""
-        result = task_benchmark_save()
-        action = result["actions"][0]
-        assert "--benchmark-enable" in action
-        assert "--benchmark-only" in action
-        assert "--benchmark-save=baseline" in action
-        assert "--benchmark-storage=tmp/benchmarks" in action
-        assert "tests/benchmarks/" in action
+        tokens = set(benchmark_save_task["actions"][0].split())
+        assert not SAVE_FLAGS - tokens
 
 
 class TestTaskBenchmarkCompare:
     """Tests for task_benchmark_compare function."""
 
-    def test_returns_valid_doit_task(self) -> None:
+    def test_returns_valid_doit_task(self, benchmark_compare_task: dict[str, Any]) -> None:
         """Test that task_benchmark_compare returns a valid doit task dict."""
-        result = task_benchmark_compare()
-        assert isinstance(result, dict)
-        assert "actions" in result
-        assert "title" in result
+        assert isinstance(benchmark_compare_task, dict)
+        assert "actions" in benchmark_compare_task
+        assert "title" in benchmark_compare_task
 
-    def test_actions_contain_compare_flags(self) -> None:
+    def test_actions_contain_compare_flags(self, benchmark_compare_task: dict[str, Any]) -> None:
         """Test that actions include compare-specific flags."""
-        result = task_benchmark_compare()
-        action = result["actions"][0]
-        assert "--benchmark-enable" in action
-        assert "--benchmark-only" in action
-        assert "--benchmark-compare=0001_baseline" in action
-        assert "--benchmark-storage=tmp/benchmarks" in action
-        assert "tests/benchmarks/" in action
+        tokens = set(benchmark_compare_task["actions"][0].split())
+        assert not COMPARE_FLAGS - tokens
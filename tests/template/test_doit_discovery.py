@@ -1,21 +1,28 @@
 """Tests for doit task autodiscovery."""
 
+from typing import Any
+
+import pytest
+
 from tools.doit import discover_tasks
 
 
+@pytest.fixture(scope="session")
+def discovered() -> dict[str, Any]:
+    """Walk and import the doit task modules once per session."""
+    return discover_tasks()
+
+
 class TestDiscoverTasks:
     """Tests for discover_tasks function."""
 
-    def test_discovers_doit_config(self) -> None:
+    def test_discovers_doit_config(self, discovered: dict[str, Any]) -> None:
         """Test that DOIT_CONFIG is discovered."""
-        discovered = discover_tasks()
         assert "DOIT_CONFIG" in discovered
         assert isinstance(discovered["DOIT_CONFIG"], dict)
 
-    def test_discovers_task_functions(self) -> None:
+    def test_discovers_task_functions(self, discovered: dict[str, Any]) -> None:
         """Test that task_* functions are discovered."""
-        discovered = discover_tasks()
-
         # Check some known tasks exist
         assert "task_build" in discovered
         assert "task_check" in discovered
@@ -23,27 +30,17 @@ class TestDiscoverTasks:
         assert "task_lint" in discovered
         assert "task_benchmark" in discovered
 
-    def test_all_discovered_tasks_are_callable(self) -> None:
-        """Test that all discovered task_* items are callable."""
-        discovered = discover_tasks()
-
+    def test_discovers_only_callable_tasks_and_config(self, discovered: dict[str, Any]) -> None:
+        """Test that only DOIT_CONFIG and callable task_* items are discovered."""
         for name, obj in discovered.items():
-            if name.startswith("task_"):
-                assert callable(obj), f"{name} should be callable"
-
-    def test_does_not_discover_private_functions(self) -> None:
-        """Test that private functions are not discovered."""
-        discovered = discover_tasks()
+            if name == "DOIT_CONFIG":
+                continue
+            # Private helpers and other module globals must not leak through
+            assert name.startswith("task_"), f"Unexpected item discovered: {name}"
+            assert callable(obj), f"{name} should be callable"
 
-        for name in discovered:
-            # Should only have task_* or DOIT_CONFIG
-            is_valid = name.startswith("task_") or name == "DOIT_CONFIG"
-            assert is_valid, f"Unexpected item discovered: {name}"
-
-    def test_discovered_tasks_return_valid_doit_format(self) -> None:
+    def test_discovered_tasks_return_valid_doit_format(self, discovered: dict[str, Any]) -> None:
         """Test that discovered tasks return valid doit task dicts."""
-        discovered = discover_tasks()
-
         # Test a few known tasks return proper dict structure
         task_build = discovered["task_build"]
         result = task_build()
@@ -37,71 +37,28 @@ from tools.doit.github import (
 class TestExtractLinkedIssues:
     """Tests for _extract_linked_issues function."""
 
-    def test_addresses_issue(self) -> None:
-        """Test extraction of 'Addresses #XX' pattern."""
-        body = "Addresses #123"
-        result = _extract_linked_issues(body)
-        assert result == ["123"]
-
-    def test_addresses_lowercase_ignored(self) -> None:
-        """Test that lowercase 'addresses #XX' is ignored."""
-        body = "addresses #456"
-        result = _extract_linked_issues(body)
-        assert result == []
-
-    def test_addresses_uppercase_ignored(self) -> None:
-        """Test that uppercase 'ADDRESSES #XX' is ignored."""
-        body = "ADDRESSES #789"
-        result = _extract_linked_issues(body)
-        assert result == []
-
-    def test_mid_sentence_ignored(self) -> None:
-        """Test that mid-sentence 'Addresses #XX' is ignored."""
-        body = "This PR Addresses #123"
-        result = _extract_linked_issues(body)
-        assert result == []
-
-    def test_multiple_addresses(self) -> None:
-        """Test extraction of multiple addresses patterns at line starts."""
-        body = "Addresses #123\nAddresses #456"
-        result = _extract_linked_issues(body)
-        assert result == ["123", "456"]
-
-    def test_duplicate_issues(self) -> None:
-        """Test that duplicate issues are removed."""
-        body = "Addresses #123\nAddresses #123"
-        result = _extract_linked_issues(body)
-        assert result == ["123"]
-
-    def test_no_issues(self) -> None:
-        """Test handling of body with no issues."""
-        body = "This PR adds a new feature"
-        result = _extract_linked_issues(body)
-        assert result == []
-
-    def test_issue_in_code_block_still_matched(self) -> None:
-        """Test that issues in code blocks are still matched (by design)."""
-        body = "```\nAddresses #123\n```"
-        result = _extract_linked_issues(body)
-        assert result == ["123"]
-
-    def test_old_closes_keyword_not_matched(self) -> None:
-        """Test that old 'Closes' keyword is not matched."""
-        body = "Closes #123"
-        result = _extract_linked_issues(body)
-        assert result == []
-
-    def test_old_fixes_keyword_not_matched(self) -> None:
-        """Test that old 'Fixes' keyword is not matched."""
-        body = "Fixes #456"
-        result = _extract_linked_issues(body)
-        assert result == []
-
-    def test_old_part_of_keyword_not_matched(self) -> None:
-        """Test that old 'Part of' keyword is not matched."""
-        body = "Part of #101"
-        result = _extract_linked_issues(body)
-        assert result == []
+    @pytest.mark.parametrize(
+        ("body", "expected"),
+        [
+            pytest.param("Addresses #123", ["123"], id="addresses"),
+            pytest.param("addresses #456", [], id="lowercase-ignored"),
+            pytest.param("ADDRESSES #789", [], id="uppercase-ignored"),
+            pytest.param("This PR Addresses #123", [], id="mid-sentence-ignored"),
+            pytest.param("Addresses #123\nAddresses #456", ["123", "456"], id="multiple"),
+            pytest.param("Addresses #123\nAddresses #123", ["123"], id="duplicates-removed"),
+            pytest.param("This PR adds a new feature", [], id="no-issues"),
+            # Code blocks are not special-cased (by design)
+            pytest.param("```\nAddresses #123\n```", ["123"], id="code-block-matched"),
+            pytest.param("<!--\nAddresses #1\n-->\nAddresses #2", ["2"], id="html-comment-ignored"),
+            # Old closing keywords are no longer recognised
+            pytest.param("Closes #123", [], id="closes-not-matched"),
+            pytest.param("Fixes #456", [], id="fixes-not-matched"),
+            pytest.param("Part of #101", [], id="part-of-not-matched"),
+        ],
+    )
+    def test_extract_linked_issues(self, body: str, expected: list[str]) -> None:
+        """Test only line-leading 'Addresses #XX' references are extracted, once each."""
+        assert _extract_linked_issues(body) == expected
 
 
 class TestFormatMergeSubject:
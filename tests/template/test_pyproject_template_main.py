@@ -995,3 +995,26 @@ class TestMigrateModule:
 
         args = parse_args(["--target", "/some/path", "--dry-run"])
         assert args.dry_run is True
+
+    def test_run_migrate_copies_into_read_only_directories(self, tmp_path: Path) -> None:
+        """Test that files under read-only template directories are all copied."""
+        from tools.pyproject_template.migrate_existing_project import run_migrate
+
+        template = tmp_path / "template"
+        target = tmp_path / "target"
+        locked = template / "docs" / "locked"
+        locked.mkdir(parents=True)
+        target.mkdir()
+        names = [f"page{i}.md" for i in range(200)]
+        for name in names:
+            (locked / name).write_text(name)
+        locked.chmod(0o555)
+        try:
+            assert run_migrate(target=target, template=template) == 0
+            copied = target / "docs" / "locked"
+            assert sorted(p.name for p in copied.iterdir()) == sorted(names)
+            assert all((copied / name).read_text() == name for name in names)
+            assert copied.stat().st_mode & 0o777 == 0o555
+        finally:
+            locked.chmod(0o755)
+            (target / "docs" / "locked").chmod(0o755)
@@ -2,16 +2,46 @@
 
 from __future__ import annotations
 
+from collections import deque
+from contextlib import ExitStack
+from typing import Any
 from unittest.mock import patch
 
+import pytest
+
+from tools.pyproject_template.repo_settings import (
+    configure_branch_protection,
+    configure_repository_settings,
+    enable_github_pages,
+    replicate_labels,
+    update_all_repo_settings,
+)
+
+
+class _FakeApi:
+    """Stand-in for ``GitHubCLI.api``/``graphql`` that replays canned responses in order.
+
+    Each call is recorded in ``calls`` as an ``(args, kwargs)`` tuple.
+    Responses that are exceptions are raised instead of returned.
+    """
+
+    def __init__(self, responses: list[Any]) -> None:
+        self.responses = deque(responses)
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401 - mirrors GitHubCLI.api
+        self.calls.append((args, kwargs))
+        response = self.responses.popleft()
+        if isinstance(response, BaseException):
+            raise response
+        return response
+
 
 class TestConfigureRepositorySettings:
     """Tests for configure_repository_settings function."""
 
     def test_configure_repository_settings_success(self) -> None:
         """Test successful repository settings configuration."""
-        from tools.pyproject_template.repo_settings import configure_repository_settings
-
         mock_template_settings = {
             "description": "Template description",
             "has_issues": True,
@@ -23,14 +53,10 @@ class TestConfigureRepositorySettings:
             "full_name": "old/name",
         }
 
-        mock_owner_info = {"type": "User"}
+        mock_current_settings = {"owner": {"type": "User"}}
 
-        with (
-            patch(
-                "tools.pyproject_template.repo_settings.GitHubCLI.api",
-                side_effect=[mock_template_settings, mock_owner_info, None],
-            ) as mock_api,
-        ):
+        api = _FakeApi([mock_template_settings, mock_current_settings, None])
+        with patch("tools.pyproject_template.repo_settings.GitHubCLI.api", new=api):
             result = configure_repository_settings(
                 repo_full="user/repo",
                 description="New description",
@@ -39,18 +65,59 @@ class TestConfigureRepositorySettings:
 
             assert result is True
             # Verify API was called correctly
-            assert mock_api.call_count == 3
+            assert len(api.calls) == 3
+            _, patch_kwargs = api.calls[2]
+            assert patch_kwargs.get("method") == "PATCH"
+            assert "id" not in patch_kwargs["data"]
+
+    def test_configure_repository_settings_patches_only_changed_fields(self) -> None:
+        """Test that fields already matching the template are not re-sent."""
+        mock_template_settings = {"has_issues": True, "has_wiki": False}
+        mock_current_settings = {
+            "owner": {"type": "User"},
+            "description": "Old description",
+            "has_issues": True,
+            "has_wiki": True,
+        }
+
+        api = _FakeApi([mock_template_settings, mock_current_settings, None])
+        with patch("tools.pyproject_template.repo_settings.GitHubCLI.api", new=api):
+            result = configure_repository_settings(
+                repo_full="user/repo",
+                description="New description",
+            )
+
+            assert result is True
+            assert api.calls[2][1]["data"] == {
+                "description": "New description",
+                "has_wiki": False,
+            }
+
+    def test_configure_repository_settings_skips_patch_when_unchanged(self) -> None:
+        """Test that no PATCH is sent when the repository already matches."""
+        mock_template_settings = {"has_issues": True, "allow_forking": True}
+        mock_current_settings = {
+            "owner": {"type": "User"},
+            "description": "Description",
+            "has_issues": True,
+        }
+
+        api = _FakeApi([mock_template_settings, mock_current_settings])
+        with patch("tools.pyproject_template.repo_settings.GitHubCLI.api", new=api):
+            result = configure_repository_settings(
+                repo_full="user/repo",
+                description="Description",
+            )
+
+            assert result is True
+            assert len(api.calls) == 2
 
     def test_configure_repository_settings_failure(self) -> None:
         """Test repository settings configuration handles failure."""
         from subprocess import CalledProcessError
 
-        from tools.pyproject_template.repo_settings import configure_repository_settings
-
-        with patch(
-            "tools.pyproject_template.repo_settings.GitHubCLI.api",
-            side_effect=CalledProcessError(1, "gh", stderr="Error"),
-        ):
+        api = _FakeApi([CalledProcessError(1, "gh", stderr="Error")])
+        with patch("tools.pyproject_template.repo_settings.GitHubCLI.api", new=api):
             result = configure_repository_settings(
                 repo_full="user/repo",
                 description="Description",
@@ -64,8 +131,6 @@ class TestConfigureBranchProtection:
 
     def test_configure_branch_protection_creates_new_ruleset(self) -> None:
         """Test creating a new ruleset when none exists."""
-        from tools.pyproject_template.repo_settings import configure_branch_protection
-
         mock_template_rulesets = [{"id": 1, "name": "main-protection"}]
         mock_existing_rulesets: list[dict[str, object]] = []  # No existing rulesets
         mock_full_ruleset = {
@@ -78,28 +143,26 @@ class TestConfigureBranchProtection:
             "rules": [],
         }
 
-        with patch(
-            "tools.pyproject_template.repo_settings.GitHubCLI.api",
-            side_effect=[
+        api = _FakeApi(
+            [
                 mock_template_rulesets,  # GET template rulesets
                 mock_existing_rulesets,  # GET existing rulesets in target repo
                 mock_full_ruleset,  # GET full ruleset details
                 None,  # POST new ruleset
-            ],
-        ) as mock_api:
+            ]
+        )
+        with patch("tools.pyproject_template.repo_settings.GitHubCLI.api", new=api):
             result = configure_branch_protection(repo_full="user/repo")
             assert result is True
             # Verify POST was used (4th call)
-            assert mock_api.call_count == 4
-            last_call = mock_api.call_args_list[3]
-            assert last_call.kwargs.get("method") == "POST"
-            assert "rulesets" in last_call.args[0]
-            assert "rulesets/" not in last_call.args[0]  # No ID in URL for POST
+            assert len(api.calls) == 4
+            args, kwargs = api.calls[3]
+            assert kwargs.get("method") == "POST"
+            assert "rulesets" in args[0]
+            assert "rulesets/" not in args[0]  # No ID in URL for POST
 
     def test_configure_branch_protection_updates_existing_ruleset(self) -> None:
         """Test updating an existing ruleset instead of creating a duplicate."""
-        from tools.pyproject_template.repo_settings import configure_branch_protection
-
         mock_template_rulesets = [{"id": 1, "name": "main-protection"}]
         mock_existing_rulesets = [{"id": 99, "name": "main-protection"}]  # Already exists
         mock_full_ruleset = {
@@ -112,31 +175,27 @@ class TestConfigureBranchProtection:
             "rules": [],
         }
 
-        with patch(
-            "tools.pyproject_template.repo_settings.GitHubCLI.api",
-            side_effect=[
+        api = _FakeApi(
+            [
                 mock_template_rulesets,  # GET template rulesets
                 mock_existing_rulesets,  # GET existing rulesets in target repo
                 mock_full_ruleset,  # GET full ruleset details
                 None,  # PUT existing ruleset
-            ],
-        ) as mock_api:
+            ]
+        )
+        with patch("tools.pyproject_template.repo_settings.GitHubCLI.api", new=api):
             result = configure_branch_protection(repo_full="user/repo")
             assert result is True
             # Verify PUT was used with correct ID (4th call)
-            assert mock_api.call_count == 4
-            last_call = mock_api.call_args_list[3]
-            assert last_call.kwargs.get("method") == "PUT"
-            assert "rulesets/99" in last_call.args[0]  # Uses existing ID
+            assert len(api.calls) == 4
+            args, kwargs = api.calls[3]
+            assert kwargs.get("method") == "PUT"
+            assert "rulesets/99" in args[0]  # Uses existing ID
 
     def test_configure_branch_protection_no_rulesets(self) -> None:
         """Test branch protection when template has no rulesets."""
-        from tools.pyproject_template.repo_settings import configure_branch_protection
-
-        with patch(
-            "tools.pyproject_template.repo_settings.GitHubCLI.api",
-            return_value=[],
-        ):
+        api = _FakeApi([[]])
+        with patch("tools.pyproject_template.repo_settings.GitHubCLI.api", new=api):
             result = configure_branch_protection(repo_full="user/repo")
             assert result is True  # No rulesets is not a failure
 
@@ -145,28 +204,86 @@ class TestReplicateLabels:
     """Tests for replicate_labels function."""
 
     def test_replicate_labels_success(self) -> None:
-        """Test successful label replication."""
-        from tools.pyproject_template.repo_settings import replicate_labels
+        """Test missing labels are created in one batched GraphQL mutation."""
+        mock_labels = [
+            {"name": "bug", "color": "d73a4a", "description": "Bug report"},
+            {"name": "enhancement", "color": "a2eeef", "description": None},
+        ]
+
+        api = _FakeApi([])
+        graphql = _FakeApi(
+            [
+                {"repository": {"labels": {"nodes": mock_labels}}},
+                {"repository": {"id": "R_1", "labels": {"nodes": [{"name": "Bug"}]}}},
+                {"label0": {"label": {"id": "L_1"}}},
+            ]
+        )
+        with (
+            patch("tools.pyproject_template.repo_settings.GitHubCLI.graphql", new=graphql),
+            patch("tools.pyproject_template.repo_settings.GitHubCLI.api", new=api),
+        ):
+            result = replicate_labels(repo_full="user/repo")
+            assert result is True
+            assert len(graphql.calls) == 3
+            assert graphql.calls[0][0][1] == {"owner": "endavis", "name": "pyproject-template"}
+            assert graphql.calls[1][0][1] == {"owner": "user", "name": "repo"}
+            # "bug" already exists (case-insensitively), so only one alias is sent
+            mutation, variables = graphql.calls[-1][0]
+            assert "label0: createLabel(" in mutation
+            assert "label1:" not in mutation
+            assert variables == {
+                "repositoryId": "R_1",
+                "name0": "enhancement",
+                "color0": "a2eeef",
+                "description0": "",
+            }
+            assert api.calls == []
+
+    def test_replicate_labels_all_present(self) -> None:
+        """Test no mutation is sent when every template label already exists."""
+        mock_labels = [{"name": "bug", "color": "d73a4a", "description": "Bug report"}]
+
+        graphql = _FakeApi(
+            [
+                {"repository": {"labels": {"nodes": mock_labels}}},
+                {"repository": {"id": "R_1", "labels": {"nodes": [{"name": "bug"}]}}},
+            ]
+        )
+        with patch("tools.pyproject_template.repo_settings.GitHubCLI.graphql", new=graphql):
+            assert replicate_labels(repo_full="user/repo") is True
+            assert len(graphql.calls) == 2
+
+    def test_replicate_labels_falls_back_to_rest(self) -> None:
+        """Test labels are POSTed one by one when the GraphQL mutation fails."""
+        from subprocess import CalledProcessError
 
         mock_labels = [
             {"name": "bug", "color": "d73a4a", "description": "Bug report"},
-            {"name": "enhancement", "color": "a2eeef", "description": "New feature"},
+            {"name": "enhancement", "color": "a2eeef", "description": None},
         ]
 
-        with patch(
-            "tools.pyproject_template.repo_settings.GitHubCLI.api",
-            side_effect=[mock_labels, None, None],
+        api = _FakeApi([None, CalledProcessError(1, "gh")])
+        graphql = _FakeApi(
+            [
+                {"repository": {"labels": {"nodes": mock_labels}}},
+                {"repository": {"id": "R_1", "labels": {"nodes": []}}},
+                CalledProcessError(1, "gh"),
+            ]
+        )
+        with (
+            patch("tools.pyproject_template.repo_settings.GitHubCLI.graphql", new=graphql),
+            patch("tools.pyproject_template.repo_settings.GitHubCLI.api", new=api),
         ):
             result = replicate_labels(repo_full="user/repo")
             assert result is True
+            assert len(api.calls) == 2
+            assert api.calls[-1][1]["data"]["description"] == ""
 
     def test_replicate_labels_empty(self) -> None:
         """Test label replication when template has no labels."""
-        from tools.pyproject_template.repo_settings import replicate_labels
-
         with patch(
-            "tools.pyproject_template.repo_settings.GitHubCLI.api",
-            return_value=[],
+            "tools.pyproject_template.repo_settings.GitHubCLI.graphql",
+            return_value={"repository": {"labels": {"nodes": []}}},
         ):
             result = replicate_labels(repo_full="user/repo")
             assert result is False
@@ -177,12 +294,8 @@ class TestEnableGithubPages:
 
     def test_enable_github_pages_success(self) -> None:
         """Test successful GitHub Pages enablement."""
-        from tools.pyproject_template.repo_settings import enable_github_pages
-
-        with patch(
-            "tools.pyproject_template.repo_settings.GitHubCLI.api",
-            return_value=None,
-        ):
+        api = _FakeApi([None])
+        with patch("tools.pyproject_template.repo_settings.GitHubCLI.api", new=api):
             result = enable_github_pages(repo_full="user/repo")
             assert result is True
 
@@ -190,12 +303,8 @@ class TestEnableGithubPages:
         """Test GitHub Pages when gh-pages branch doesn't exist."""
         from subprocess import CalledProcessError
 
-        from tools.pyproject_template.repo_settings import enable_github_pages
-
-        with patch(
-            "tools.pyproject_template.repo_settings.GitHubCLI.api",
-            side_effect=CalledProcessError(1, "gh"),
-        ):
+        api = _FakeApi([CalledProcessError(1, "gh")])
+        with patch("tools.pyproject_template.repo_settings.GitHubCLI.api", new=api):
             result = enable_github_pages(repo_full="user/repo")
             assert result is False
 
@@ -209,64 +318,27 @@ class TestUpdateAllRepoSettings:
     for the migration from the default-setup API to the workflow file.
     """
 
-    def test_update_all_repo_settings_success(self) -> None:
-        """Test that update_all_repo_settings calls all configuration functions."""
-        from tools.pyproject_template.repo_settings import update_all_repo_settings
-
-        with (
-            patch(
-                "tools.pyproject_template.repo_settings.configure_repository_settings",
-                return_value=True,
-            ) as mock_repo,
-            patch(
-                "tools.pyproject_template.repo_settings.configure_branch_protection",
-                return_value=True,
-            ) as mock_branch,
-            patch(
-                "tools.pyproject_template.repo_settings.replicate_labels",
-                return_value=True,
-            ) as mock_labels,
-            patch(
-                "tools.pyproject_template.repo_settings.enable_github_pages",
-                return_value=True,
-            ) as mock_pages,
-        ):
-            result = update_all_repo_settings(
-                repo_full="user/repo",
-                description="Description",
-            )
-
-            assert result is True
-            mock_repo.assert_called_once()
-            mock_branch.assert_called_once()
-            mock_labels.assert_called_once()
-            mock_pages.assert_called_once()
-
-    def test_update_all_repo_settings_partial_failure(self) -> None:
-        """Test that update_all_repo_settings returns False if any step fails."""
-        from tools.pyproject_template.repo_settings import update_all_repo_settings
-
-        with (
-            patch(
-                "tools.pyproject_template.repo_settings.configure_repository_settings",
-                return_value=True,
-            ),
-            patch(
-                "tools.pyproject_template.repo_settings.configure_branch_protection",
-                return_value=False,  # This one fails
-            ),
-            patch(
-                "tools.pyproject_template.repo_settings.replicate_labels",
-                return_value=True,
-            ),
-            patch(
-                "tools.pyproject_template.repo_settings.enable_github_pages",
-                return_value=True,
-            ),
-        ):
+    @pytest.mark.parametrize(("branch_rv", "expected"), [(True, True), (False, False)])
+    def test_update_all_repo_settings(self, branch_rv: bool, expected: bool) -> None:
+        """Test that every step runs and any failing step fails the whole update."""
+        return_values = {
+            "configure_repository_settings": True,
+            "configure_branch_protection": branch_rv,
+            "replicate_labels": True,
+            "enable_github_pages": True,
+        }
+        with ExitStack() as stack:
+            mocks = [
+                stack.enter_context(
+                    patch(f"tools.pyproject_template.repo_settings.{name}", return_value=rv)
+                )
+                for name, rv in return_values.items()
+            ]
             result = update_all_repo_settings(
                 repo_full="user/repo",
                 description="Description",
             )
 
-            assert result is False
+        assert result is expected
+        for mock in mocks:
+            mock.assert_called_once()
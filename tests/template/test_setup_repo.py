@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import contextlib
 import subprocess
+import sys
+import threading
+from collections.abc import Callable
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from tools.pyproject_template.utils import PARALLEL_MIN_FILES
+
 
 class TestRepositorySetup:
     """Tests for RepositorySetup class."""
@@ -37,6 +43,53 @@ class TestRepositorySetup:
         assert "Python Project Template" in captured.out
         assert "Repository Setup" in captured.out
 
+    def test_print_manual_steps_outputs_repo_links(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that print_manual_steps lists secrets and settings for the repo."""
+        from tools.pyproject_template.setup_repo import RepositorySetup
+
+        setup = RepositorySetup()
+        setup.config = {"repo_full": "owner/repo", "repo_name": "repo"}
+        setup.print_manual_steps()
+
+        out = capsys.readouterr().out
+        assert "Setup Complete!" in out
+        assert "gh secret set PYPI_TOKEN --repo owner/repo" in out
+        assert "https://github.com/owner/repo/settings/rules" in out
+        assert "     cd repo\n" in out
+        # Blocks written in one call still end on a newline before the next log line
+        assert out.index("Manual steps required") < out.index("Template tooling")
+
+    def test_create_github_repository_reports_existing_name(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test the error details and solution for a taken repository name."""
+        import subprocess
+
+        from tools.pyproject_template.setup_repo import RepositorySetup
+
+        setup = RepositorySetup()
+        setup.config = {
+            "repo_owner": "owner",
+            "repo_name": "repo",
+            "repo_full": "owner/repo",
+            "description": "",
+            "visibility": "public",
+        }
+        error = subprocess.CalledProcessError(1, "gh", stderr="Name already exists\n")
+
+        with (
+            patch("tools.pyproject_template.setup_repo.GitHubCLI.api", side_effect=error),
+            pytest.raises(SystemExit),
+        ):
+            setup.create_github_repository()
+
+        out = capsys.readouterr().out
+        assert "  Name already exists\n\n" in out
+        assert out.index("Error details") < out.index("'repo' already exists")
+        assert out.endswith("https://github.com/owner/repo/settings\n\n")
+
     def test_check_requirements_fails_without_git(self) -> None:
         """Test that check_requirements exits if git is not installed."""
         from tools.pyproject_template.setup_repo import RepositorySetup
@@ -100,6 +153,45 @@ class TestRepositorySetup:
             # Should not raise
             setup.check_requirements()
 
+    @pytest.mark.parametrize("stream", ["stdout", "stderr"])
+    def test_check_token_permissions_detects_pat(self, stream: str) -> None:
+        """Test that a PAT is detected in either gh auth status stream."""
+        from tools.pyproject_template.setup_repo import RepositorySetup
+
+        setup = RepositorySetup()
+        output = {"stdout": "", "stderr": ""}
+        output[stream] = "Token: github_pat_****"
+
+        with (
+            patch(
+                "tools.pyproject_template.setup_repo.subprocess.run",
+                return_value=MagicMock(returncode=0, **output),
+            ),
+            patch(
+                "tools.pyproject_template.setup_repo.prompt_confirm", return_value=True
+            ) as mock_confirm,
+        ):
+            setup._check_token_permissions()
+
+        mock_confirm.assert_called_once()
+
+    def test_check_token_permissions_oauth(self) -> None:
+        """Test that an OAuth token does not prompt for PAT permissions."""
+        from tools.pyproject_template.setup_repo import RepositorySetup
+
+        setup = RepositorySetup()
+
+        with (
+            patch(
+                "tools.pyproject_template.setup_repo.subprocess.run",
+                return_value=MagicMock(returncode=0, stdout="Token: ****", stderr=None),
+            ),
+            patch("tools.pyproject_template.setup_repo.prompt_confirm") as mock_confirm,
+        ):
+            setup._check_token_permissions()
+
+        mock_confirm.assert_not_called()
+
     def test_gather_inputs_with_git_config(self) -> None:
         """Test that gather_inputs uses git config values as defaults."""
         from tools.pyproject_template.setup_repo import RepositorySetup
@@ -455,6 +547,120 @@ class TestRunOrder:
         )
 
 
+class TestConfigureGithubSettings:
+    """Tests for RepositorySetup.configure_github_settings()."""
+
+    STEPS = (
+        "configure_repository_settings",
+        "configure_branch_protection",
+        "replicate_labels",
+        "enable_github_pages",
+    )
+
+    def _patch_steps(
+        self, setup: object, make_step: Callable[[str], Callable[[], None]]
+    ) -> contextlib.ExitStack:
+        stack = contextlib.ExitStack()
+        for name in self.STEPS:
+            stack.enter_context(patch.object(setup, name, side_effect=make_step(name)))
+        return stack
+
+    def test_output_replayed_in_step_order(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Steps finishing out of order still log in submission order."""
+        from tools.pyproject_template.setup_repo import RepositorySetup
+
+        setup = RepositorySetup()
+        first_may_finish = threading.Event()
+
+        def make_step(name: str) -> Callable[[], None]:
+            def step() -> None:
+                if name == self.STEPS[1]:
+                    # Finish last of the concurrent steps: wait until the final step has run
+                    first_may_finish.wait(timeout=5)
+                print(f"start {name}")
+                print(f"error {name}", file=sys.stderr)
+                if name == self.STEPS[-1]:
+                    first_may_finish.set()
+
+            return step
+
+        with self._patch_steps(setup, make_step):
+            setup.configure_github_settings()
+
+        captured = capsys.readouterr()
+        assert captured.out == "".join(f"start {name}\n" for name in self.STEPS)
+        assert captured.err == "".join(f"error {name}\n" for name in self.STEPS)
+
+    def test_repository_settings_applied_before_other_steps(self) -> None:
+        """The settings PATCH (which can change visibility) lands before the rest start."""
+        from tools.pyproject_template.setup_repo import RepositorySetup
+
+        setup = RepositorySetup()
+        settings_done = threading.Event()
+        started_early: list[str] = []
+
+        def make_step(name: str) -> Callable[[], None]:
+            def step() -> None:
+                if name == self.STEPS[0]:
+                    settings_done.set()
+                elif not settings_done.is_set():
+                    started_early.append(name)
+
+            return step
+
+        with self._patch_steps(setup, make_step):
+            setup.configure_github_settings()
+
+        assert started_early == []
+
+    def test_serial_runs_steps_in_order(self) -> None:
+        """serial=True calls each step on the calling thread, in order."""
+        from tools.pyproject_template.setup_repo import RepositorySetup
+
+        setup = RepositorySetup(serial=True)
+        calls: list[tuple[str, str]] = []
+
+        def make_step(name: str) -> Callable[[], None]:
+            return lambda: calls.append((name, threading.current_thread().name))
+
+        with self._patch_steps(setup, make_step):
+            setup.configure_github_settings()
+
+        main_thread = threading.current_thread().name
+        assert calls == [(name, main_thread) for name in self.STEPS]
+
+    def test_step_exception_is_reraised_after_output(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Every step's output is replayed before the first exception propagates."""
+        from tools.pyproject_template.setup_repo import RepositorySetup
+
+        setup = RepositorySetup()
+
+        def make_step(name: str) -> Callable[[], None]:
+            def step() -> None:
+                print(f"ran {name}")
+                if name == "replicate_labels":
+                    raise SystemExit(1)
+                if name == "enable_github_pages":
+                    raise SystemExit(2)
+
+            return step
+
+        with self._patch_steps(setup, make_step), pytest.raises(SystemExit) as exc_info:
+            setup.configure_github_settings()
+
+        assert exc_info.value.code == 1
+        out = capsys.readouterr().out
+        # The later step ran concurrently, so its output is shown too
+        assert (
+            "ran configure_branch_protection\nran replicate_labels\nran enable_github_pages\n"
+            in out
+        )
+        # Streams are restored once the steps have finished
+        assert not type(sys.stdout).__name__.startswith("_ThreadBuffered")
+
+
 class TestVerifyPostCleanup:
     """Tests for RepositorySetup.verify_post_cleanup().
 
@@ -635,3 +841,29 @@ class TestConfigurePlaceholdersTemplateTestsRemoval:
 
         assert (tmp_path / "tests").exists()
         assert not (tmp_path / "tests" / "template").exists()
+
+    def test_configure_placeholders_rewrites_many_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """configure_placeholders() rewrites every collected file, pooled or not."""
+        from tools.pyproject_template.setup_repo import RepositorySetup
+
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        # Enough files to take the thread-pool path
+        for i in range(PARALLEL_MIN_FILES):
+            (docs_dir / f"page{i}.md").write_text("# __PACKAGE_NAME__\n", encoding="utf-8")
+        (tmp_path / "README.md").write_text("by Your Name\n", encoding="utf-8")
+
+        monkeypatch.chdir(tmp_path)
+
+        setup = RepositorySetup()
+        setup.config = self._minimum_config()
+
+        with patch("tools.pyproject_template.setup_repo.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+            setup.configure_placeholders()
+
+        for i in range(PARALLEL_MIN_FILES):
+            assert (docs_dir / f"page{i}.md").read_text(encoding="utf-8") == "# test_pkg\n"
+        assert (tmp_path / "README.md").read_text(encoding="utf-8") == "by Test Author\n"
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import io
+import zipfile
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -14,6 +16,7 @@ from tools.pyproject_template.utils import (
     GitHubCLI,
     Logger,
     command_exists,
+    download_and_extract_archive,
     get_first_author,
     get_git_config,
     is_github_url,
@@ -106,21 +109,20 @@ class TestCommandExists:
 
     def test_existing_command(self) -> None:
         """Test that existing commands are detected."""
-        # 'which' should exist on Linux/macOS
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
+        with patch("shutil.which", return_value="/usr/bin/python") as mock_which:
             assert command_exists("python") is True
+            mock_which.assert_called_once_with("python")
 
     def test_nonexistent_command(self) -> None:
         """Test that non-existent commands return False."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=1)
+        with patch("shutil.which", return_value=None):
             assert command_exists("nonexistent_command_xyz") is False
 
-    def test_handles_exception(self) -> None:
-        """Test that exceptions are handled gracefully."""
-        with patch("subprocess.run", side_effect=FileNotFoundError):
-            assert command_exists("anything") is False
+    def test_does_not_spawn_subprocess(self) -> None:
+        """Test that the PATH lookup happens in-process."""
+        with patch("subprocess.run") as mock_run:
+            command_exists("anything")
+            mock_run.assert_not_called()
 
 
 class TestGetGitConfig:
@@ -488,6 +490,67 @@ class TestUpdateFileModes:
         assert "New marker: my_pkg" in content
         assert "Old literal: my_pkg" in content
 
+    def test_substituted_values_are_not_rescanned(self, tmp_path: Path) -> None:
+        """A value containing a later key is inserted verbatim (single pass)."""
+        test_file = tmp_path / "readme.md"
+        test_file.write_text("__DESCRIPTION__ by username\n", encoding="utf-8")
+
+        update_file(
+            test_file,
+            {"__DESCRIPTION__": "Look up a username", "username": "testuser"},
+        )
+
+        assert test_file.read_text(encoding="utf-8") == "Look up a username by testuser\n"
+
+    def test_earlier_key_wins_at_same_position(self, tmp_path: Path) -> None:
+        """A longer key listed first takes precedence over its prefix."""
+        test_file = tmp_path / "ci.yml"
+        test_file.write_text("repo: username/package_name, user: username\n", encoding="utf-8")
+
+        update_file(
+            test_file,
+            {"username/package_name": "me/pkg", "username": "me", "package_name": "x"},
+        )
+
+        assert test_file.read_text(encoding="utf-8") == "repo: me/pkg, user: me\n"
+
+    def test_python_replacement_value_is_literal(self, tmp_path: Path) -> None:
+        """Backslashes in a value are not treated as regex group references."""
+        test_file = tmp_path / "mod.py"
+        test_file.write_text("print(username)\n", encoding="utf-8")
+
+        update_file(test_file, {"username": r"dom\1user"})
+
+        assert test_file.read_text(encoding="utf-8") == "print(dom\\1user)\n"
+
+    def test_file_without_matches_is_not_rewritten(self, tmp_path: Path) -> None:
+        """A file with no placeholder keeps its exact bytes (e.g. CRLF endings)."""
+        test_file = tmp_path / "notes.txt"
+        test_file.write_bytes(b"nothing to see\r\n")
+
+        update_file(test_file, {"username": "testuser"})
+
+        assert test_file.read_bytes() == b"nothing to see\r\n"
+
+    def test_large_file_without_keys_is_skipped(self, tmp_path: Path) -> None:
+        """A large file is scanned via mmap and not decoded when no key occurs."""
+        test_file = tmp_path / "data.txt"
+        test_file.write_bytes(b"x" * (300 * 1024))
+
+        with patch.object(Path, "read_text") as mock_read:
+            update_file(test_file, {"username": "testuser"})
+
+        mock_read.assert_not_called()
+
+    def test_large_file_with_key_is_updated(self, tmp_path: Path) -> None:
+        """A large file containing a key is still rewritten."""
+        test_file = tmp_path / "data.txt"
+        test_file.write_text("x" * (300 * 1024) + "username\n", encoding="utf-8")
+
+        update_file(test_file, {"username": "testuser"})
+
+        assert test_file.read_text(encoding="utf-8").endswith("xtestuser\n")
+
 
 class TestColors:
     """Tests for Colors class."""
@@ -565,6 +628,35 @@ class TestGitHubCLI:
             with pytest.raises(subprocess.CalledProcessError):
                 GitHubCLI.run(["repo", "view"])
 
+    def test_api_sends_compact_json_body(self) -> None:
+        """Test api pipes the request body as compact JSON and parses the reply."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout='{"id": 1}')
+            result = GitHubCLI.api("repos/o/r/labels", method="POST", data={"name": "bug"})
+            assert result == {"id": 1}
+            assert mock_run.call_args.args[0][-2:] == ["--input", "-"]
+            assert mock_run.call_args.kwargs["input"] == '{"name":"bug"}'
+
+    def test_graphql_returns_data_payload(self) -> None:
+        """Test graphql passes the query and variables and unwraps ``data``."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=0, stdout='{"data": {"repository": {"name": "repo"}}}'
+            )
+            result = GitHubCLI.graphql(
+                "query { x }", {"owner": "me", "first": 10, "archived": False, "after": None}
+            )
+            assert result == {"repository": {"name": "repo"}}
+            cmd = mock_run.call_args.args[0]
+            assert cmd[:5] == ["gh", "api", "graphql", "-f", "query=query { x }"]
+            assert cmd[5:] == ["-f", "owner=me", "-F", "first=10", "-F", "archived=false"]
+
+    def test_graphql_empty_output(self) -> None:
+        """Test graphql returns None when gh prints nothing."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="")
+            assert GitHubCLI.graphql("query { x }") is None
+
     def test_is_authenticated_true(self) -> None:
         """Test is_authenticated returns True when authenticated."""
         with patch("subprocess.run") as mock_run:
@@ -583,6 +675,26 @@ class TestGitHubCLI:
             assert GitHubCLI.is_authenticated() is False
 
 
+class TestDownloadAndExtractArchive:
+    """Tests for download_and_extract_archive function."""
+
+    def test_extracts_zip_without_writing_archive(self, tmp_path: Path) -> None:
+        """Test the zip is extracted straight from the download, leaving no archive file."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            zf.writestr("pyproject-template-main/README.md", "# Template")
+            zf.writestr("../escape.txt", "nope")
+        buffer.seek(0)
+
+        with patch("urllib.request.urlopen", return_value=buffer):
+            root = download_and_extract_archive("https://example.com/main.zip", tmp_path)
+
+        assert root == tmp_path / "extracted" / "pyproject-template-main"
+        assert (root / "README.md").read_text(encoding="utf-8") == "# Template"
+        assert not (tmp_path / "escape.txt").exists()
+        assert [p.name for p in tmp_path.iterdir()] == ["extracted"]
+
+
 class TestTemplateOwnedTestFilesInvariant:
     """Invariants that enforce TEMPLATE_OWNED_TEST_FILES as the single source of truth."""
 
@@ -21,6 +21,18 @@ if TYPE_CHECKING:
 ADR_DIR = Path("docs/decisions")
 TEMPLATE_SERIES_FLOOR = 9001
 
+_SLUG_SEPARATOR_PATTERN = re.compile(r"[\s_]+")
+_SLUG_INVALID_PATTERN = re.compile(r"[^a-z0-9-]")
+_SLUG_HYPHENS_PATTERN = re.compile(r"-+")
+
+# A "## Name" heading and its body, up to the next "##"-level heading
+_SECTION_PATTERN = re.compile(
+    r"^##\s+(?P<name>[^\n]*?)\s*\n(?P<body>.*?)(?=^##|\Z)", re.DOTALL | re.MULTILINE
+)
+
+# Lowercased openings of the ADR template's placeholder text
+_PLACEHOLDER_PREFIXES = ("brief summary", "why this decision", "issue #xx")
+
 
 def _get_next_adr_number(template: bool = False) -> int:
     """Get the next available ADR number for the requested series.
@@ -82,11 +94,11 @@ def _title_to_slug(title: str) -> str:
     # Convert to lowercase
     slug = title.lower()
     # Replace spaces and underscores with hyphens
-    slug = re.sub(r"[\s_]+", "-", slug)
+    slug = _SLUG_SEPARATOR_PATTERN.sub("-", slug)
     # Remove non-alphanumeric characters except hyphens
-    slug = re.sub(r"[^a-z0-9-]", "", slug)
+    slug = _SLUG_INVALID_PATTERN.sub("", slug)
     # Collapse multiple hyphens
-    slug = re.sub(r"-+", "-", slug)
+    slug = _SLUG_HYPHENS_PATTERN.sub("-", slug)
     # Trim hyphens from ends
     slug = slug.strip("-")
     return slug
@@ -178,17 +190,18 @@ def _validate_adr_content(content: str, console: "ConsoleType") -> bool:
     """
     required_sections = get_adr_required_sections()
 
-    for section in required_sections:
-        # Look for ## Section header followed by content
-        # Use MULTILINE so ^ matches start of line
-        pattern = rf"^##\s+{re.escape(section)}\s*\n(.*?)(?=^##|\Z)"
-        match = re.search(pattern, content, re.DOTALL | re.IGNORECASE | re.MULTILINE)
+    # Index every section in one pass; the first heading of a given name
+    # wins and names compare case-insensitively
+    sections: dict[str, str] = {}
+    for match in _SECTION_PATTERN.finditer(content):
+        sections.setdefault(match["name"].lower(), match["body"].strip())
 
-        if not match:
+    for section in required_sections:
+        section_content = sections.get(section.lower())
+        if section_content is None:
             console.print(f"[red]Missing required section: {section}[/red]")
             return False
 
-        section_content = match.group(1).strip()
         if not section_content or _is_placeholder_content(section_content):
             console.print(
                 f"[red]Section '{section}' is empty or contains only placeholder text.[/red]"
@@ -207,13 +220,7 @@ def _is_placeholder_content(content: str) -> bool:
     Returns:
         True if content appears to be placeholder text
     """
-    placeholder_patterns = [
-        r"^brief summary",
-        r"^why this decision",
-        r"^issue #xx",
-    ]
-    content_lower = content.lower().strip()
-    return any(re.match(pattern, content_lower) for pattern in placeholder_patterns)
+    return content.strip().lower().startswith(_PLACEHOLDER_PREFIXES)
 
 
 def _prepare_editor_template(title: str, number: int, date: str) -> str:
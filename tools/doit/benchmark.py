@@ -4,11 +4,15 @@ from typing import Any
 
 from doit.tools import title_with_actions
 
+# Shared command prefix and storage flag for every benchmark task
+_BENCH_CMD = "uv run pytest tests/benchmarks/ --benchmark-enable --benchmark-only"
+_BENCH_STORAGE = "--benchmark-storage=tmp/benchmarks"
+
 
 def task_benchmark() -> dict[str, Any]:
     """Run performance benchmarks."""
     return {
-        "actions": ["uv run pytest tests/benchmarks/ --benchmark-enable --benchmark-only -v"],
+        "actions": [f"{_BENCH_CMD} -v"],
         "title": title_with_actions,
         "verbosity": 0,
     }
@@ -17,10 +21,7 @@ def task_benchmark() -> dict[str, Any]:
 def task_benchmark_save() -> dict[str, Any]:
     """Run benchmarks and save results as baseline."""
     return {
-        "actions": [
-            "uv run pytest tests/benchmarks/ --benchmark-enable --benchmark-only "
-            "--benchmark-save=baseline --benchmark-storage=tmp/benchmarks -v"
-        ],
+        "actions": [f"{_BENCH_CMD} --benchmark-save=baseline {_BENCH_STORAGE} -v"],
         "title": title_with_actions,
         "verbosity": 0,
     }
@@ -29,10 +30,7 @@ def task_benchmark_save() -> dict[str, Any]:
 def task_benchmark_compare() -> dict[str, Any]:
     """Run benchmarks and compare against saved baseline."""
     return {
-        "actions": [
-            "uv run pytest tests/benchmarks/ --benchmark-enable --benchmark-only "
-            "--benchmark-compare=0001_baseline --benchmark-storage=tmp/benchmarks -v"
-        ],
+        "actions": [f"{_BENCH_CMD} --benchmark-compare=0001_baseline {_BENCH_STORAGE} -v"],
         "title": title_with_actions,
         "verbosity": 0,
     }
@@ -61,6 +61,12 @@ _PR_TITLE_PATTERN = re.compile(
     r"^(feat|fix|refactor|docs|test|chore|ci|perf|release)(\(.+\))?:\s.+"
 )
 
+# Only a line-leading, case-sensitive "Addresses #N" links an issue; GitHub's
+# own closing keywords (Closes/Fixes/...) are deliberately not matched.
+_LINKED_ISSUE_PATTERN = re.compile(r"^Addresses\s+#(\d+)", re.MULTILINE)
+
+_HTML_COMMENT_PATTERN = re.compile(r"<!--.*?-->", re.DOTALL)
+
 
 def _is_transient_gh_error(stderr: str) -> str | None:
     """Return the matched transient-error marker, or ``None`` if not transient.
@@ -237,7 +243,7 @@ def _open_editor_with_template(template: str, suffix: str = ".md") -> str | None
         edited = "\n".join(lines)
 
         # Remove HTML comments <!-- ... -->
-        edited = re.sub(r"<!--.*?-->", "", edited, flags=re.DOTALL)
+        edited = _HTML_COMMENT_PATTERN.sub("", edited)
 
         # Clean up extra blank lines
         edited = re.sub(r"\n{3,}", "\n\n", edited).strip()
@@ -694,23 +700,19 @@ def _extract_linked_issues(body: str) -> list[str]:
     Looks for patterns like:
     - Addresses #123
 
+    References inside HTML comments (e.g. left over from the PR template)
+    are ignored.
+
     Args:
         body: PR body text
 
     Returns:
         List of issue numbers referenced with "Addresses"
     """
-    seen: set[str] = set()
-    result: list[str] = []
-
-    pattern = r"^Addresses\s+#(\d+)"
-    for match in re.finditer(pattern, body, re.MULTILINE):
-        issue = match.group(1)
-        if issue not in seen:
-            seen.add(issue)
-            result.append(issue)
-
-    return result
+    if "<!--" in body:
+        body = _HTML_COMMENT_PATTERN.sub("", body)
+    # dict.fromkeys drops repeats while keeping first-seen order
+    return list(dict.fromkeys(_LINKED_ISSUE_PATTERN.findall(body)))
 
 
 def _format_merge_subject(title: str, pr_number: int, issues: list[str]) -> str:
@@ -724,15 +726,9 @@ def _format_merge_subject(title: str, pr_number: int, issues: list[str]) -> str:
     Returns:
         Formatted subject: "<type>: <subject> (merges PR #XX, addresses #YY)"
     """
-    # Build the suffix parts
-    parts = [f"merges PR #{pr_number}"]
-
-    if issues:
-        issue_refs = ", ".join(f"#{i}" for i in issues)
-        parts.append(f"addresses {issue_refs}")
-
-    suffix = f"({', '.join(parts)})"
-    return f"{title} {suffix}"
+    if not issues:
+        return f"{title} (merges PR #{pr_number})"
+    return f"{title} (merges PR #{pr_number}, addresses #{', #'.join(issues)})"
 
 
 def _close_linked_issues(issues: list[str], pr_number: int, console: Console) -> None:
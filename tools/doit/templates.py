@@ -13,6 +13,13 @@ from typing import Any, NamedTuple
 
 import yaml
 
+# Issue templates are parsed with libyaml's C loader when PyYAML was built
+# with it; the pure-Python SafeLoader accepts the same documents.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 
 class AdrTemplate(NamedTuple):
     """Parsed ADR template with editor content and metadata."""
@@ -61,8 +68,9 @@ FIELD_ID_TO_SECTION = {
 }
 
 
+@lru_cache(maxsize=1)
 def _get_github_dir() -> Path:
-    """Get the .github directory path."""
+    """Get the .github directory path (cached; the walk stats each parent)."""
     # Find project root by looking for .github directory
     current = Path(__file__).resolve()
     for parent in [current, *list(current.parents)]:
@@ -82,7 +90,7 @@ def _parse_yaml_template(template_path: Path) -> dict[str, Any]:
         Parsed YAML content as dict
     """
     with open(template_path, encoding="utf-8") as f:
-        result: dict[str, Any] = yaml.safe_load(f)
+        result: dict[str, Any] = yaml.load(f, Loader=_SafeLoader)  # nosec B506
         return result
 
 
@@ -255,6 +263,7 @@ def clear_template_cache() -> None:
     get_issue_template.cache_clear()
     get_pr_template.cache_clear()
     get_adr_template.cache_clear()
+    _get_github_dir.cache_clear()
 
 
 def _get_docs_dir() -> Path:
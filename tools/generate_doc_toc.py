@@ -24,10 +24,19 @@ For full documentation, see issue #169.
 from __future__ import annotations
 
 import re
+from collections import defaultdict
 from pathlib import Path
+from typing import BinaryIO, NamedTuple
 
 import yaml
 
+# libyaml's C loader parses frontmatter several times faster than the
+# pure-Python SafeLoader; fall back to it when PyYAML was built without libyaml.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 DOCS_DIR = Path("docs")
 TOC_FILE = DOCS_DIR / "TABLE_OF_CONTENTS.md"
 
@@ -36,14 +45,75 @@ EXCLUDE_FILES = {
     "TABLE_OF_CONTENTS.md",
 }
 
-# Pattern to match template markers
+# Pattern to match opening template markers
 # Matches: <!-- BEGIN:key=value,value2 --> or <!-- BEGIN:all -->
-MARKER_PATTERN = re.compile(
-    r"(<!-- BEGIN:(\w+)(?:=([^\s>]+))? -->)"  # Opening marker
-    r"(.*?)"  # Content between markers (non-greedy)
-    r"(<!-- END:\2(?:=\3)? -->)",  # Closing marker
-    re.DOTALL,
-)
+# The closing <!-- END:key --> or <!-- END:key=value,value2 --> is located with
+# str.find (see _find_end_marker) rather than a backreference.
+BEGIN_MARKER_PATTERN = re.compile(r"<!-- BEGIN:(\w+)(?:=([^\s>]+))? -->")
+
+
+# First markdown heading, used as the title when frontmatter has none.
+# Matched on raw bytes so the body is never decoded as a whole.
+_HEADING_PATTERN = re.compile(rb"^#\s+(.+)$", re.MULTILINE)
+
+
+class DocEntry(NamedTuple):
+    """A documentation page with everything the TOC needs from it."""
+
+    path: Path
+    meta: dict
+    title: str
+    description: str
+    labels: dict[str, frozenset[str]]  # Filterable frontmatter values, per key
+    sort_key: str  # Casefolded title, so TOC ordering ignores case
+
+
+def split_frontmatter(raw: bytes) -> tuple[dict, bytes]:
+    """Split raw markdown bytes into frontmatter metadata and body.
+
+    Only the frontmatter block is decoded; the body is returned undecoded.
+
+    Args:
+        raw: Full markdown file content as UTF-8 bytes.
+
+    Returns:
+        Tuple of (metadata, body). Metadata is empty if there is no frontmatter
+        block or it fails to parse; body is the content after the block.
+    """
+    if not raw.startswith(b"---"):
+        return {}, raw
+
+    # Find the closing ---
+    end_idx = raw.find(b"---", 3)
+    if end_idx == -1:
+        return {}, raw
+
+    body = raw[end_idx + 3 :]
+    try:
+        frontmatter_str = raw[3:end_idx].decode("utf-8")
+        meta = yaml.load(frontmatter_str, Loader=_SafeLoader) or {}  # nosec B506
+    except (UnicodeDecodeError, yaml.YAMLError):
+        meta = {}
+    return meta, body
+
+
+def _read_frontmatter_head(f: BinaryIO) -> bytes:
+    """Read an open markdown file up to the end of its frontmatter block.
+
+    Stops after the line holding the closing ``---``, so the body is only
+    read if a caller asks for it. Returns just the first line when the file
+    has no frontmatter, and the whole file when the block is never closed.
+    """
+    head = f.readline()
+    if not head.startswith(b"---") or b"---" in head[3:]:
+        return head
+
+    lines = [head]
+    for line in f:
+        lines.append(line)
+        if b"---" in line:
+            break
+    return b"".join(lines)
 
 
 def extract_frontmatter(path: Path) -> dict:
@@ -55,26 +125,19 @@ def extract_frontmatter(path: Path) -> dict:
     Returns:
         Dictionary of frontmatter metadata, empty if none found.
     """
-    content = path.read_text(encoding="utf-8")
-
-    if not content.startswith("---"):
-        return {}
-
-    try:
-        # Find the closing ---
-        end_idx = content.index("---", 3)
-        frontmatter_str = content[3:end_idx]
-        return yaml.safe_load(frontmatter_str) or {}
-    except (ValueError, yaml.YAMLError):
-        return {}
+    with path.open("rb") as f:
+        meta, _ = split_frontmatter(_read_frontmatter_head(f))
+    return meta
 
 
-def get_title(path: Path, meta: dict) -> str:
+def get_title(path: Path, meta: dict, body: bytes | None = None) -> str:
     """Get document title from frontmatter or first heading.
 
     Args:
         path: Path to markdown file.
         meta: Frontmatter metadata dictionary.
+        body: Content after the frontmatter, if already read; otherwise the
+            file is read again.
 
     Returns:
         Document title string.
@@ -82,112 +145,159 @@ def get_title(path: Path, meta: dict) -> str:
     if "title" in meta:
         return str(meta["title"])
 
-    content = path.read_text(encoding="utf-8")
-
-    # Skip frontmatter if present
-    if content.startswith("---"):
-        try:
-            end_idx = content.index("---", 3)
-            content = content[end_idx + 3 :]
-        except ValueError:
-            pass
+    if body is None:
+        _, body = split_frontmatter(path.read_bytes())
 
     # Find first heading
-    match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
+    match = _HEADING_PATTERN.search(body)
     if match:
-        return match.group(1).strip()
+        return match.group(1).decode("utf-8").strip()
 
     return path.stem.replace("-", " ").replace("_", " ").title()
 
 
-def collect_docs() -> list[tuple[Path, dict]]:
-    """Collect all documentation files with their metadata.
+def read_doc(path: Path) -> DocEntry:
+    """Read a markdown file once and extract its TOC entry.
+
+    The body past the frontmatter is only read when the title has to come
+    from the first heading.
+
+    Args:
+        path: Path to markdown file.
 
     Returns:
-        List of (path, metadata) tuples.
+        DocEntry with the file's metadata, title and description.
     """
-    docs = []
+    with path.open("rb") as f:
+        meta, body = split_frontmatter(_read_frontmatter_head(f))
+        if "title" not in meta:
+            body += f.read()
+    title = get_title(path, meta, body)
+    return DocEntry(path, meta, title, meta.get("description", ""), _labels(meta), title.casefold())
 
-    for path in sorted(DOCS_DIR.rglob("*.md")):
-        if path.name in EXCLUDE_FILES:
-            continue
 
-        meta = extract_frontmatter(path)
-        docs.append((path, meta))
+def _labels(meta: dict) -> dict[str, frozenset[str]]:
+    """Normalize string and list-of-string frontmatter values to sets for filtering."""
+    labels = {}
+    for key, value in meta.items():
+        if isinstance(value, str):
+            labels[key] = frozenset((value,))
+        elif isinstance(value, list):
+            labels[key] = frozenset(v for v in value if isinstance(v, str))
+    return labels
 
-    return docs
 
+def _toc_order(doc: DocEntry) -> tuple[str, Path]:
+    """Sort key for TOC listings: title ignoring case, then path for ties."""
+    return doc.sort_key, doc.path
 
-def matches_filter(meta: dict, filter_key: str, filter_values: list[str]) -> bool:
-    """Check if document metadata matches the filter criteria.
 
-    Args:
-        meta: Document frontmatter metadata.
-        filter_key: Key to filter on ('audience', 'tag', 'tags', 'all').
-        filter_values: Values to match (OR logic).
+def collect_docs() -> list[DocEntry]:
+    """Collect all documentation files with their metadata.
 
     Returns:
-        True if document matches filter.
+        List of DocEntry tuples, one per file, in TOC order (by title, then path).
     """
-    if filter_key == "all":
-        return True
+    docs = [read_doc(path) for path in DOCS_DIR.rglob("*.md") if path.name not in EXCLUDE_FILES]
+    docs.sort(key=_toc_order)
+    return docs
 
-    # Normalize 'tag' to 'tags'
-    key = "tags" if filter_key == "tag" else filter_key
 
-    doc_values = meta.get(key, [])
+def build_index(docs: list[DocEntry]) -> dict[tuple[str, str], list[DocEntry]]:
+    """Map each (frontmatter key, value) pair to the docs that carry it.
 
-    # Handle string values (convert to list)
-    if isinstance(doc_values, str):
-        doc_values = [doc_values]
+    Built once per run, so each TOC marker looks up its documents instead of
+    scanning every entry.
 
-    # OR logic: match if any filter value is in doc values
-    return any(v in doc_values for v in filter_values)
+    Args:
+        docs: List of DocEntry tuples.
+
+    Returns:
+        Dictionary of (key, value) to matching docs, in ``docs`` (TOC) order.
+    """
+    index: defaultdict[tuple[str, str], list[DocEntry]] = defaultdict(list)
+    for doc in docs:
+        for key, values in doc.labels.items():
+            for value in values:
+                index[key, value].append(doc)
+    return dict(index)
 
 
 def generate_section(
-    docs: list[tuple[Path, dict]], filter_key: str, filter_values: list[str]
+    docs: list[DocEntry],
+    index: dict[tuple[str, str], list[DocEntry]],
+    filter_key: str,
+    filter_values: frozenset[str],
 ) -> str:
     """Generate markdown list for documents matching filter.
 
     Args:
-        docs: List of (path, metadata) tuples.
-        filter_key: Key to filter on.
-        filter_values: Values to match.
+        docs: List of DocEntry tuples.
+        index: Lookup table from :func:`build_index`.
+        filter_key: Key to filter on ('audience', 'tag', 'tags', 'all').
+        filter_values: Values to match (OR logic).
 
     Returns:
         Markdown formatted list of matching documents.
     """
-    lines = []
+    if filter_key == "all":
+        matched = docs
+    else:
+        # Normalize 'tag' to 'tags'
+        key = "tags" if filter_key == "tag" else filter_key
+        # OR logic: a doc matches if it carries any filter value; keyed by
+        # path so a doc listed under several values appears once
+        matched = list(
+            {
+                doc.path: doc for value in filter_values for doc in index.get((key, value), ())
+            }.values()
+        )
+        # Each index list is already in TOC order; only a union of several
+        # needs re-sorting
+        if len(filter_values) > 1:
+            matched.sort(key=_toc_order)
+
+    if not matched:
+        return "*No documents in this category.*\n"
 
-    for path, meta in docs:
-        if not matches_filter(meta, filter_key, filter_values):
-            continue
+    lines = []
+    for doc in matched:
+        line = f"- [{doc.title}]({doc.path.relative_to(DOCS_DIR)})"
+        if doc.description:
+            line += f" - {doc.description}"
+        lines.append(line)
 
-        rel_path = path.relative_to(DOCS_DIR)
-        title = get_title(path, meta)
-        description = meta.get("description", "")
+    return "\n".join(lines) + "\n"
 
-        line = f"- [{title}]({rel_path})"
-        if description:
-            line += f" - {description}"
 
-        lines.append((title.lower(), line))  # Sort key, line
+def _find_end_marker(
+    content: str, filter_key: str, filter_values_str: str | None, start: int
+) -> tuple[int, str] | None:
+    """Find the first END marker closing a BEGIN marker.
 
-    # Sort alphabetically by title
-    lines.sort(key=lambda x: x[0])
+    Args:
+        content: TOC file content.
+        filter_key: Key from the BEGIN marker.
+        filter_values_str: Raw values from the BEGIN marker, if any.
+        start: Offset just past the BEGIN marker.
 
-    if not lines:
-        return "*No documents in this category.*\n"
+    Returns:
+        Tuple of (offset, marker text) for the earliest closing marker, or
+        None if the BEGIN marker is never closed.
+    """
+    candidates = [f"<!-- END:{filter_key} -->"]
+    if filter_values_str is not None:
+        candidates.append(f"<!-- END:{filter_key}={filter_values_str} -->")
 
-    return "\n".join(line for _, line in lines) + "\n"
+    found = [(idx, marker) for marker in candidates if (idx := content.find(marker, start)) != -1]
+    return min(found) if found else None
 
 
-def update_toc(docs: list[tuple[Path, dict]]) -> bool:
+def update_toc(docs: list[DocEntry]) -> bool:
     """Update TABLE_OF_CONTENTS.md with generated sections.
 
     Args:
-        docs: List of (path, metadata) tuples.
+        docs: List of DocEntry tuples.
 
     Returns:
         True if file was modified, False otherwise.
@@ -197,20 +307,32 @@ def update_toc(docs: list[tuple[Path, dict]]) -> bool:
         return False
 
     original_content = TOC_FILE.read_text(encoding="utf-8")
+    index = build_index(docs)
 
-    def replace_marker(match: re.Match) -> str:
-        begin_marker = match.group(1)
-        filter_key = match.group(2)
-        filter_values_str = match.group(3) or ""
-        end_marker = match.group(5)
+    # Single left-to-right pass: copy text up to each BEGIN marker, then the
+    # generated section and its END marker, skipping the old section body
+    parts = []
+    pos = 0
+    while begin := BEGIN_MARKER_PATTERN.search(original_content, pos):
+        filter_key, filter_values_str = begin.group(1), begin.group(2)
+        parts.append(original_content[pos : begin.end()])
+        pos = begin.end()
 
-        filter_values = [v.strip() for v in filter_values_str.split(",") if v.strip()]
+        end = _find_end_marker(original_content, filter_key, filter_values_str, pos)
+        if end is None:
+            continue  # Unclosed marker: leave it as is
+        end_idx, end_marker = end
 
-        section = generate_section(docs, filter_key, filter_values)
+        filter_values = frozenset(
+            v.strip() for v in (filter_values_str or "").split(",") if v.strip()
+        )
+        section = generate_section(docs, index, filter_key, filter_values)
 
-        return f"{begin_marker}\n{section}{end_marker}"
+        parts.append(f"\n{section}{end_marker}")
+        pos = end_idx + len(end_marker)
 
-    new_content = MARKER_PATTERN.sub(replace_marker, original_content)
+    parts.append(original_content[pos:])
+    new_content = "".join(parts)
 
     if new_content != original_content:
         TOC_FILE.write_text(new_content, encoding="utf-8")
@@ -231,7 +353,7 @@ def main() -> int:
     print(f"Found {len(docs)} documentation files")
 
     # Count docs with frontmatter
-    with_frontmatter = sum(1 for _, meta in docs if meta)
+    with_frontmatter = sum(1 for doc in docs if doc.meta)
     print(f"  - {with_frontmatter} with frontmatter")
     print(f"  - {len(docs) - with_frontmatter} without frontmatter")
 
@@ -41,6 +41,14 @@ DANGEROUS_SEQUENCES = [
     (["sudo", "rm"], "Privileged deletion"),
 ]
 
+# DANGEROUS_SEQUENCES lowercased once and keyed by first token, so each
+# command token only tries the sequences that can start there.
+# Values are (position in DANGEROUS_SEQUENCES, sequence, description).
+_SEQUENCES_BY_HEAD: dict[str, list[tuple[int, list[str], str]]] = {}
+for _order, (_sequence, _reason) in enumerate(DANGEROUS_SEQUENCES):
+    _lowered = [s.lower() for s in _sequence]
+    _SEQUENCES_BY_HEAD.setdefault(_lowered[0], []).append((_order, _lowered, _reason))
+
 # Force push flags
 FORCE_PUSH_FLAGS = {"--force", "-f", "--force-with-lease"}
 
@@ -189,15 +197,19 @@ def check_dangerous_sequences(tokens: list[str]) -> tuple[bool, str]:
     """
     Check if dangerous token sequences appear in the command.
 
-    Looks for consecutive tokens matching dangerous patterns.
+    Looks for consecutive tokens matching dangerous patterns. When several
+    match, the one listed first in DANGEROUS_SEQUENCES is reported.
     """
     tokens_lower = [t.lower() for t in tokens]
 
-    for sequence, reason in DANGEROUS_SEQUENCES:
-        seq_len = len(sequence)
-        for i in range(len(tokens_lower) - seq_len + 1):
-            if tokens_lower[i : i + seq_len] == [s.lower() for s in sequence]:
-                return True, reason
+    matches = [
+        (order, reason)
+        for i, token in enumerate(tokens_lower)
+        for order, sequence, reason in _SEQUENCES_BY_HEAD.get(token, ())
+        if tokens_lower[i : i + len(sequence)] == sequence
+    ]
+    if matches:
+        return True, min(matches)[1]
     return False, ""
 
 
@@ -30,7 +30,9 @@ import re
 import shutil
 import subprocess  # nosec B404
 import sys
+import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 try:
@@ -45,6 +47,7 @@ if str(_script_dir) not in sys.path:
 
 # Import shared utilities
 from utils import (  # noqa: E402
+    PARALLEL_MIN_FILES,
     TEMPLATE_OWNED_TEST_FILES,
     TEMPLATE_REPO,
     TEMPLATE_URL,
@@ -59,6 +62,9 @@ _TEMPLATE_OWNED_TEST_SET: frozenset[str] = frozenset(TEMPLATE_OWNED_TEST_FILES)
 # Default archive URL derived from template constants
 DEFAULT_ARCHIVE_URL = f"{TEMPLATE_URL}/archive/refs/heads/main.zip"
 
+# ETag and tag of the last releases/latest response, relative to the tmp dir
+RELEASE_CACHE_FILE = ".gh-release-cache.json"
+
 # Project-managed exclude file: paths or globs of upstream files the downstream
 # project intentionally does not adopt. See docs/template/manage.md.
 SYNC_EXCLUDE_FILE = Path(".config/pyproject_template/sync-exclude.toml")
@@ -98,18 +104,55 @@ def load_sync_excludes(project_root: Path) -> list[str]:
     return [str(item) for item in excludes if isinstance(item, str)]
 
 
-def get_latest_release() -> str | None:
-    """Get the latest release tag from GitHub API."""
+def _load_release_cache(cache_path: Path) -> dict[str, str]:
+    """Load the cached releases/latest ETag and tag, or return an empty cache."""
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {k: v for k, v in data.items() if isinstance(v, str)}
+
+
+def get_latest_release(cache_path: Path | None = None) -> str | None:
+    """Get the latest release tag from GitHub API.
+
+    When ``cache_path`` is given, the previous response's ETag is sent as
+    ``If-None-Match``. A ``304 Not Modified`` reply returns the cached tag
+    without a body transfer, and does not count against the unauthenticated
+    API rate limit.
+    """
     api_url = f"https://api.github.com/repos/{TEMPLATE_REPO}/releases/latest"
+    cache = _load_release_cache(cache_path) if cache_path else {}
+    headers: dict[str, str] = {}
+    if cache.get("etag") and cache.get("tag_name"):
+        headers["If-None-Match"] = cache["etag"]
+    request = urllib.request.Request(api_url, headers=headers)
     try:
-        with urllib.request.urlopen(api_url) as response:  # nosec B310
+        with urllib.request.urlopen(request) as response:  # nosec B310
             data = json.loads(response.read())
             tag_name: str | None = data.get("tag_name")
-            return tag_name
+            etag = response.headers.get("ETag")
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and headers:
+            return cache["tag_name"]
+        Logger.warning(f"Could not fetch latest release: {e}")
+        return None
     except Exception as e:
         Logger.warning(f"Could not fetch latest release: {e}")
         return None
 
+    if cache_path and etag and tag_name:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(
+                json.dumps({"etag": etag, "tag_name": tag_name}) + "\n", encoding="utf-8"
+            )
+        except OSError:
+            pass  # The cache is an optimization; a failed write is not an error
+    return tag_name
+
 
 def download_template(target_dir: Path, version: str | None = None) -> Path:
     """Download and extract template to target directory."""
@@ -144,6 +187,37 @@ def open_changelog(template_dir: Path) -> None:
         Logger.warning(f"Editor '{editor}' not found, skipping changelog view")
 
 
+# Files/directories to skip (build artifacts, never user-configurable).
+_SKIP_NAMES = frozenset(
+    {
+        ".git",
+        ".venv",
+        "venv",
+        "__pycache__",
+        "tmp",
+        ".pytest_cache",
+        ".mypy_cache",
+        ".ruff_cache",
+        "uv.lock",
+        ".envrc.local",
+        "site",  # mkdocs build output
+    }
+)
+_SKIP_GLOBS = ("*.pyc", "*.pyo")
+
+
+def _files_match(template_file: Path, project_file: Path) -> bool:
+    """Return True if ``project_file`` exists with the same bytes as ``template_file``.
+
+    ``filecmp.cmp`` already returns early on a size mismatch and only reads
+    same-size files, stopping at the first differing chunk.
+    """
+    try:
+        return filecmp.cmp(template_file, project_file, shallow=False)
+    except FileNotFoundError:
+        return False  # Missing from the project
+
+
 def compare_files(
     project_root: Path,
     template_root: Path,
@@ -163,29 +237,12 @@ def compare_files(
         ``(different_files, excluded_files)``. Both lists contain upstream-relative
         paths whose contents differ from the project. Files matching ``excludes``
         appear only in ``excluded_files``; everything else lands in
-        ``different_files``. Files matching the hardcoded ``skip_patterns`` set
-        are not in either list.
+        ``different_files``. Files matching the hardcoded ``_SKIP_NAMES`` /
+        ``_SKIP_GLOBS`` are not in either list.
     """
     if excludes is None:
         excludes = load_sync_excludes(project_root)
 
-    # Files/directories to skip (build artifacts, never user-configurable).
-    skip_patterns = {
-        ".git",
-        ".venv",
-        "venv",
-        "__pycache__",
-        "tmp",
-        ".pytest_cache",
-        ".mypy_cache",
-        ".ruff_cache",
-        "*.pyc",
-        "*.pyo",
-        "uv.lock",
-        ".envrc.local",
-        "site",  # mkdocs build output
-    }
-
     # Detect user's actual package name (directory under src/ that isn't package_name)
     actual_package_name: str | None = None
     src_dir = project_root / "src"
@@ -195,34 +252,50 @@ def compare_files(
                 actual_package_name = item.name
                 break
 
-    different_files: list[Path] = []
-    excluded_files: list[Path] = []
+    # (upstream-relative path, template file, project file) to compare
+    candidates: list[tuple[Path, Path, Path]] = []
+
+    # Walk through template files, pruning skipped directories (.git, .venv,
+    # caches, ...) so their contents are never listed at all.
+    for dirpath, dirnames, filenames in os.walk(template_root):
+        dirnames[:] = [name for name in dirnames if name not in _SKIP_NAMES]
+        rel_dir = Path(dirpath).relative_to(template_root)
+        for filename in filenames:
+            # Skip hardcoded build-artifact patterns.
+            if filename in _SKIP_NAMES or any(
+                fnmatch.fnmatch(filename, pattern) for pattern in _SKIP_GLOBS
+            ):
+                continue
+            rel_path = rel_dir / filename
+            template_file = template_root / rel_path
 
-    # Walk through template files
-    for template_file in template_root.rglob("*"):
-        if not template_file.is_file():
-            continue
+            # Map src/package_name/* to src/{actual_package_name}/*
+            mapped_path = rel_path
+            if (
+                actual_package_name
+                and len(rel_path.parts) >= 2
+                and rel_path.parts[0] == "src"
+                and rel_path.parts[1] == "package_name"
+            ):
+                mapped_path = Path("src", actual_package_name, *rel_path.parts[2:])
 
-        # Skip hardcoded build-artifact patterns.
-        rel_path = template_file.relative_to(template_root)
-        if any(part in skip_patterns for part in rel_path.parts):
-            continue
-        if any(rel_path.match(pattern) for pattern in skip_patterns):
-            continue
+            candidates.append((rel_path, template_file, project_root / mapped_path))
+
+    # Byte comparisons are independent and mostly waiting on reads (which
+    # release the GIL), so overlap them for larger trees.
+    template_files = [template_file for _, template_file, _ in candidates]
+    project_files = [project_file for _, _, project_file in candidates]
+    if len(candidates) < PARALLEL_MIN_FILES:
+        matches = list(map(_files_match, template_files, project_files))
+    else:
+        with ThreadPoolExecutor() as pool:
+            matches = list(pool.map(_files_match, template_files, project_files))
 
-        # Map src/package_name/* to src/{actual_package_name}/*
-        mapped_path = rel_path
-        if (
-            actual_package_name
-            and len(rel_path.parts) >= 2
-            and rel_path.parts[0] == "src"
-            and rel_path.parts[1] == "package_name"
-        ):
-            mapped_path = Path("src", actual_package_name, *rel_path.parts[2:])
-
-        # Compare with project file
-        project_file = project_root / mapped_path
-        if project_file.exists() and filecmp.cmp(template_file, project_file, shallow=False):
+    different_files: list[Path] = []
+    excluded_files: list[Path] = []
+
+    for (rel_path, _, _), match in zip(candidates, matches, strict=True):
+        if match:
             continue  # Files match; nothing to report.
 
         # File differs (or is missing). Bucket it.
@@ -365,7 +438,7 @@ def run_check_updates(
         version = template_version
         Logger.info(f"Comparing against template version: {version}")
     else:
-        version = get_latest_release()
+        version = get_latest_release(tmp_dir / RELEASE_CACHE_FILE)
         if version:
             Logger.info(f"Latest template release: {version}")
         else:
@@ -403,6 +476,8 @@ def run_check_updates(
         print(f"\n{Colors.YELLOW}Files different from template ({count} files):{Colors.NC}")
         print("━" * 60)
 
+        # Build the whole listing first so it goes out in a single write
+        lines = []
         for file_path in different_files:
             # Map src/package_name/* to src/{actual_package_name}/* for checking
             mapped_path = file_path
@@ -416,9 +491,10 @@ def run_check_updates(
 
             project_file = project_root / mapped_path
             if project_file.exists():
-                print(f"  {file_path}")
+                lines.append(f"  {file_path}")
             else:
-                print(f"  {file_path} {Colors.CYAN}(new in template){Colors.NC}")
+                lines.append(f"  {file_path} {Colors.CYAN}(new in template){Colors.NC}")
+        print("\n".join(lines))
 
         # Coupling guard: warn when a non-template-owned drifted test imports
         # tooling that has also drifted — the user needs to bootstrap --sync first.
@@ -22,6 +22,8 @@ Usage:
 
 from __future__ import annotations
 
+import argparse
+import functools
 import re
 import shutil
 import sys
@@ -146,6 +148,12 @@ def get_dirs_to_delete(mode: CleanupMode, root: Path | None = None) -> list[Path
     return existing_dirs
 
 
+# Template section of the mkdocs.yml nav: from "  - Template:" through its
+# nested "      - " entries. Edited as text rather than through a YAML
+# round-trip so comments and formatting in the rest of the file survive.
+_MKDOCS_TEMPLATE_NAV_RE = re.compile(r"(  - Template:\n(?:      - [^\n]+\n)*)")
+
+
 def update_mkdocs_nav(root: Path | None = None, dry_run: bool = False) -> bool:
     """Remove Template section from mkdocs.yml navigation.
 
@@ -160,23 +168,19 @@ def update_mkdocs_nav(root: Path | None = None, dry_run: bool = False) -> bool:
         root = Path.cwd()
 
     mkdocs_file = root / "mkdocs.yml"
-    if not mkdocs_file.exists():
+    try:
+        content = mkdocs_file.read_text(encoding="utf-8")
+    except FileNotFoundError:
         return False
 
-    content = mkdocs_file.read_text(encoding="utf-8")
-
-    # Pattern to match the Template section in nav
-    # Matches from "  - Template:" to the next "  - " at the same indent level or end of nav
-    pattern = r"(  - Template:\n(?:      - [^\n]+\n)*)"
-
-    if not re.search(pattern, content):
+    new_content, count = _MKDOCS_TEMPLATE_NAV_RE.subn("", content)
+    if not count:
         return False
 
     if dry_run:
         Logger.info("Would remove Template section from mkdocs.yml")
         return True
 
-    new_content = re.sub(pattern, "", content)
     mkdocs_file.write_text(new_content, encoding="utf-8")
     Logger.success("Removed Template section from mkdocs.yml")
     return True
@@ -661,12 +665,15 @@ def cleanup_template_files(
             failed.append((file_path, str(e)))
 
     # Delete directories (only for ALL mode, and only after files are deleted)
-    # Sort by depth (deepest first) to avoid deleting parent before child
+    # Sort by depth (deepest first) to avoid deleting parent before child.
+    # shutil.rmtree already unlinks entries relative to an open directory fd
+    # where the platform supports it (shutil.rmtree.avoids_symlink_attacks).
     for dir_path in sorted(dirs_to_delete, key=lambda p: len(p.parts), reverse=True):
         try:
-            if dir_path.exists():
-                shutil.rmtree(dir_path)
-                deleted_dirs.append(dir_path)
+            shutil.rmtree(dir_path)
+            deleted_dirs.append(dir_path)
+        except FileNotFoundError:
+            pass  # Already gone
         except OSError as e:
             failed.append((dir_path, str(e)))
 
@@ -750,10 +757,9 @@ def prompt_cleanup(root: Path | None = None) -> CleanupMode | None:
             print("Invalid option. Please enter 1, 2, or 3.")
 
 
-def main() -> int:
-    """Main entry point for standalone usage."""
-    import argparse
-
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser once; ``parse_args`` keeps no state between calls."""
     parser = argparse.ArgumentParser(description="Remove template-specific files from the project.")
     parser.add_argument(
         "--setup",
@@ -771,7 +777,17 @@ def main() -> int:
         help="Show what would be deleted without actually deleting",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv: list[str] | None = None, cwd: Path | None = None) -> int:
+    """Main entry point for standalone usage.
+
+    Args:
+        argv: Command-line arguments (defaults to ``sys.argv[1:]``)
+        cwd: Project root directory (defaults to cwd)
+    """
+    args = _build_parser().parse_args(argv)
 
     # Determine mode
     if args.setup and args.all:
@@ -789,7 +805,7 @@ def main() -> int:
             return 0
 
     # Perform cleanup
-    result = cleanup_template_files(mode, dry_run=args.dry_run)
+    result = cleanup_template_files(mode, cwd, dry_run=args.dry_run)
 
     if args.dry_run:
         Logger.info("Dry run complete. No files were deleted.")
@@ -25,8 +25,10 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import os
 import shutil
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 # Support running as script or as module
@@ -112,6 +114,20 @@ def ensure_exists(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def move_to_backup(src: Path, backup_path: Path) -> None:
+    """Move an existing item into the backup directory.
+
+    The backup lives under the target's own tmp/, so a plain rename
+    almost always works. shutil.move (copy + delete) is only the fallback,
+    e.g. when tmp/ is a separate mount.
+    """
+    ensure_exists(backup_path.parent)
+    try:
+        os.replace(src, backup_path)
+    except OSError:
+        shutil.move(str(src), str(backup_path))
+
+
 def run_migrate(
     target: Path,
     template: Path | None = None,
@@ -165,32 +181,59 @@ def run_migrate(
     skipped: list[Path] = []
     would_backup: list[Path] = []
 
-    for rel in TEMPLATE_REL_PATHS:
-        src = template_root / rel
-        dst = target_root / rel
-
-        if not src.exists():
-            skipped.append(src)
-            continue
+    # Directories are created on this thread and every file copy goes to the
+    # pool; directory metadata is only applied once all files have landed, so
+    # read-only template directories don't block the writes into them
+    pending: list[Future[object]] = []
+    copied_trees: list[tuple[Path, Path]] = []
+    with ThreadPoolExecutor() as pool:
+
+        def copy_file(src_file: str, dst_file: str) -> None:
+            pending.append(pool.submit(shutil.copy2, src_file, dst_file))
+
+        def copy_tree(src_tree: Path, dst_tree: Path) -> None:
+            for dirpath, _dirnames, filenames in os.walk(src_tree, followlinks=True):
+                dst_dir = dst_tree / Path(dirpath).relative_to(src_tree)
+                dst_dir.mkdir(parents=True)
+                for name in filenames:
+                    copy_file(os.path.join(dirpath, name), str(dst_dir / name))
+
+        for rel in TEMPLATE_REL_PATHS:
+            src = template_root / rel
+            dst = target_root / rel
+
+            if not src.exists():
+                skipped.append(src)
+                continue
+
+            if dst.exists():
+                if dry_run:
+                    would_backup.append(dst)
+                else:
+                    backup_path = backup_root / rel
+                    move_to_backup(dst, backup_path)
+                    backed_up.append((dst, backup_path))
 
-        if dst.exists():
             if dry_run:
-                would_backup.append(dst)
-            else:
-                backup_path = backup_root / rel
-                ensure_exists(backup_path.parent)
-                shutil.move(str(dst), str(backup_path))
-                backed_up.append((dst, backup_path))
-
-        if dry_run:
-            copied.append(dst)
-        else:
-            if src.is_dir():
-                shutil.copytree(src, dst)
+                copied.append(dst)
             else:
-                ensure_exists(dst.parent)
-                shutil.copy2(src, dst)
-            copied.append(dst)
+                if src.is_dir():
+                    copy_tree(src, dst)
+                    copied_trees.append((src, dst))
+                else:
+                    ensure_exists(dst.parent)
+                    copy_file(str(src), str(dst))
+                copied.append(dst)
+
+        # Re-raise the first failed copy, as a serial copytree would have
+        for future in pending:
+            future.result()
+
+    # Copy directory metadata (mtimes, modes) last and innermost first, so
+    # neither file writes nor later chmods disturb it
+    for src_tree, dst_tree in copied_trees:
+        for dirpath, _dirnames, _filenames in os.walk(src_tree, topdown=False, followlinks=True):
+            shutil.copystat(dirpath, dst_tree / Path(dirpath).relative_to(src_tree))
 
     print("\n=== Template Migration Helper ===")
     print(f"Template: {template_root}")
@@ -143,10 +143,10 @@ def configure_repository_settings(
         # Override description with user's description
         data["description"] = description
 
-        # Check if repository is in an organization
-        repo_owner = repo_full.split("/")[0]
-        owner_info = GitHubCLI.api(f"users/{repo_owner}")
-        is_org = owner_info.get("type") == "Organization"
+        # The target repository's current settings tell us whether it is in
+        # an organization and which template values it already has
+        current_settings = GitHubCLI.api(f"repos/{repo_full}")
+        is_org = (current_settings.get("owner") or {}).get("type") == "Organization"
 
         # Remove allow_forking if not an org repo (only applies to orgs)
         if not is_org and "allow_forking" in data:
@@ -155,9 +155,16 @@ def configure_repository_settings(
         # Remove security_and_analysis - we'll handle it separately
         security_settings = data.pop("security_and_analysis", None)
 
-        # Apply all settings in one call
-        GitHubCLI.api(f"repos/{repo_full}", method="PATCH", data=data)
-        Logger.success("Repository settings configured")
+        # Only send fields that differ; a repository freshly generated from
+        # the template usually matches already, so the PATCH can be skipped
+        data = {key: value for key, value in data.items() if current_settings.get(key) != value}
+
+        if data:
+            # Apply all remaining settings in one call
+            GitHubCLI.api(f"repos/{repo_full}", method="PATCH", data=data)
+            Logger.success("Repository settings configured")
+        else:
+            Logger.success("Repository settings already match template")
 
         # Configure security and analysis settings separately
         if security_settings:
@@ -323,6 +330,127 @@ def configure_branch_protection(
         return False
 
 
+# One GraphQL request returns every template label; the REST endpoint pages
+# at 30 labels and would need one round-trip per page.
+_TEMPLATE_LABELS_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    labels(first: 100) {
+      nodes { name color description }
+    }
+  }
+}
+"""
+
+
+def _fetch_template_labels(template_repo: str) -> list[dict[str, Any]]:
+    """Fetch the template's labels in a single GraphQL round-trip.
+
+    Args:
+        template_repo: Template repository (owner/repo)
+
+    Returns:
+        List of label dicts with ``name``, ``color`` and ``description`` keys
+    """
+    owner, name = template_repo.split("/", 1)
+    data = GitHubCLI.graphql(_TEMPLATE_LABELS_QUERY, {"owner": owner, "name": name})
+    repository = (data or {}).get("repository") or {}
+    nodes: list[dict[str, Any]] = (repository.get("labels") or {}).get("nodes") or []
+    return nodes
+
+
+_TARGET_LABELS_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    id
+    labels(first: 100) {
+      nodes { name }
+    }
+  }
+}
+"""
+
+
+def _build_create_labels_mutation(count: int) -> str:
+    """Build a mutation with one aliased ``createLabel`` field per label.
+
+    Label values are bound as variables (``$name0``, ``$color0``, ...) rather
+    than inlined, so names and descriptions need no GraphQL escaping.
+    """
+    params = ["$repositoryId: ID!"]
+    fields = []
+    for i in range(count):
+        params.append(f"$name{i}: String!, $color{i}: String!, $description{i}: String")
+        fields.append(
+            f"label{i}: createLabel(input: {{repositoryId: $repositoryId, name: $name{i}, "
+            f"color: $color{i}, description: $description{i}}}) {{ label {{ id }} }}"
+        )
+    return "mutation(" + ", ".join(params) + ") {\n  " + "\n  ".join(fields) + "\n}"
+
+
+def _create_labels_batched(repo_full: str, labels: list[dict[str, Any]]) -> bool:
+    """Create the labels missing from a repository in one GraphQL mutation.
+
+    Labels the repository already has are skipped up front, because a single
+    failing alias makes ``gh`` reject the whole batch.
+
+    Args:
+        repo_full: Full repository name (owner/repo)
+        labels: Label dicts with ``name``, ``color`` and ``description`` keys
+
+    Returns:
+        True if the batch was sent, False if the repository ID was unavailable
+
+    Raises:
+        subprocess.CalledProcessError: If either GraphQL request fails
+    """
+    owner, name = repo_full.split("/", 1)
+    data = GitHubCLI.graphql(_TARGET_LABELS_QUERY, {"owner": owner, "name": name})
+    repository = (data or {}).get("repository") or {}
+    repository_id = repository.get("id")
+    if not repository_id:
+        return False
+
+    existing = {
+        node["name"].lower() for node in (repository.get("labels") or {}).get("nodes") or []
+    }
+    missing = [label for label in labels if label["name"].lower() not in existing]
+    if not missing:
+        return True
+
+    variables: dict[str, Any] = {"repositoryId": repository_id}
+    for i, label in enumerate(missing):
+        variables[f"name{i}"] = label["name"]
+        variables[f"color{i}"] = label["color"]
+        variables[f"description{i}"] = label.get("description") or ""
+    GitHubCLI.graphql(_build_create_labels_mutation(len(missing)), variables)
+    return True
+
+
+def _create_labels_rest(repo_full: str, labels: list[dict[str, Any]]) -> None:
+    """Create labels with one REST call each, ignoring ones that already exist.
+
+    Args:
+        repo_full: Full repository name (owner/repo)
+        labels: Label dicts with ``name``, ``color`` and ``description`` keys
+    """
+    for label in labels:
+        try:
+            label_data = {
+                "name": label["name"],
+                "color": label["color"],
+                "description": label.get("description") or "",
+            }
+            GitHubCLI.api(
+                f"repos/{repo_full}/labels",
+                method="POST",
+                data=label_data,
+            )
+        except subprocess.CalledProcessError:
+            # Label might already exist, skip
+            pass
+
+
 def replicate_labels(
     repo_full: str,
     template_repo: str = TEMPLATE_REPO,
@@ -340,28 +468,19 @@ def replicate_labels(
 
     try:
         # Get labels from template
-        labels = GitHubCLI.api(f"repos/{template_repo}/labels")
+        labels = _fetch_template_labels(template_repo)
 
         if not labels:
             Logger.warning("Could not retrieve labels from template")
             return False
 
-        # Create each label
-        for label in labels:
-            try:
-                label_data = {
-                    "name": label["name"],
-                    "color": label["color"],
-                    "description": label.get("description", ""),
-                }
-                GitHubCLI.api(
-                    f"repos/{repo_full}/labels",
-                    method="POST",
-                    data=label_data,
-                )
-            except subprocess.CalledProcessError:
-                # Label might already exist, skip
-                pass
+        try:
+            batched = _create_labels_batched(repo_full, labels)
+        except subprocess.CalledProcessError:
+            # GraphQL mutations can be unavailable (e.g. older GHES)
+            batched = False
+        if not batched:
+            _create_labels_rest(repo_full, labels)
 
         Logger.success("Labels replicated")
         return True
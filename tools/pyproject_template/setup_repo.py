@@ -20,12 +20,16 @@ Author: Generated from pyproject-template
 License: MIT
 """
 
+import io
 import os
 import shutil
 import subprocess  # nosec B404
 import sys
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 # Support running as script or as module
 _script_dir = Path(__file__).parent
@@ -51,6 +55,7 @@ from repo_settings import (  # noqa: E402
 # Import shared utilities
 from utils import (  # noqa: E402
     FILES_TO_UPDATE,
+    PARALLEL_MIN_FILES,
     TEMPLATE_REPO,
     Colors,
     GitHubCLI,
@@ -64,6 +69,86 @@ from utils import (  # noqa: E402
 )
 # isort: on
 
+# Banners are built once at import and emitted with a single write each.
+_BANNER = (
+    "\n"
+    f"{Colors.CYAN}╔═══════════════════════════════════════════════════════════╗{Colors.NC}\n"
+    f"{Colors.CYAN}║                                                           ║{Colors.NC}\n"
+    f"{Colors.CYAN}║     Python Project Template - Repository Setup            ║{Colors.NC}\n"
+    f"{Colors.CYAN}║                                                           ║{Colors.NC}\n"
+    f"{Colors.CYAN}╚═══════════════════════════════════════════════════════════╝{Colors.NC}\n"
+    "\n"
+)
+
+_COMPLETE_BANNER = (
+    "\n"
+    f"{Colors.CYAN}╔═══════════════════════════════════════════════════════════╗{Colors.NC}\n"
+    f"{Colors.CYAN}║                  Setup Complete! 🎉                       ║{Colors.NC}\n"
+    f"{Colors.CYAN}╚═══════════════════════════════════════════════════════════╝{Colors.NC}\n"
+    "\n"
+)
+
+
+def _write_lines(lines: list[str]) -> None:
+    """Write a block of lines to stdout in one call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _update_files(paths: list[Path], replacements: dict[str, str], serial: bool = False) -> None:
+    """Apply ``update_file`` to each path, using a thread pool for larger sets.
+
+    Each file is read, rewritten and written independently, so the file I/O
+    of one overlaps with the substitutions of another. The first error is
+    re-raised, as it would be from the serial loop.
+    """
+    if serial or len(paths) < PARALLEL_MIN_FILES:
+        for path in paths:
+            update_file(path, replacements)
+        return
+    with ThreadPoolExecutor() as pool:
+        list(pool.map(lambda path: update_file(path, replacements), paths))
+
+
+# Output written by the current worker thread, as (real stream, text) pairs
+_task_output = threading.local()
+
+
+class _ThreadBufferedStream(io.TextIOBase):
+    """Stand-in for sys.stdout/sys.stderr while setup steps run concurrently.
+
+    Writes from a thread running :func:`_run_buffered` are recorded for later
+    replay; writes from any other thread pass straight through.
+    """
+
+    def __init__(self, target: TextIO) -> None:
+        self.target = target
+
+    def write(self, text: str) -> int:
+        records = getattr(_task_output, "records", None)
+        if records is None:
+            return self.target.write(text)
+        records.append((self.target, text))
+        return len(text)
+
+    def flush(self) -> None:
+        self.target.flush()
+
+
+def _run_buffered(
+    step: Callable[[], Any],
+) -> tuple[list[tuple[TextIO, str]], BaseException | None]:
+    """Run a step on a worker thread, recording its output instead of printing it."""
+    _task_output.records = []
+    try:
+        step()
+        error = None
+    except BaseException as e:  # includes SystemExit; re-raised by the caller
+        error = e
+    finally:
+        records: list[tuple[TextIO, str]] = _task_output.records
+        del _task_output.records
+    return records, error
+
 
 class RepositorySetup:
     """Main class for repository setup orchestration."""
@@ -71,29 +156,15 @@ class RepositorySetup:
     # Use TEMPLATE_REPO from utils.py as the single source of truth
     TEMPLATE_FULL = TEMPLATE_REPO
 
-    def __init__(self) -> None:
+    def __init__(self, serial: bool = False) -> None:
         self.config: dict[str, Any] = {}
         self.start_dir = os.getcwd()
+        # Run the GitHub configuration steps one after another (for debugging)
+        self.serial = serial
 
     def print_banner(self) -> None:
         """Print welcome banner."""
-        print()
-        print(
-            f"{Colors.CYAN}╔═══════════════════════════════════════════════════════════╗{Colors.NC}"
-        )
-        print(
-            f"{Colors.CYAN}║                                                           ║{Colors.NC}"
-        )
-        print(
-            f"{Colors.CYAN}║     Python Project Template - Repository Setup            ║{Colors.NC}"
-        )
-        print(
-            f"{Colors.CYAN}║                                                           ║{Colors.NC}"
-        )
-        print(
-            f"{Colors.CYAN}╚═══════════════════════════════════════════════════════════╝{Colors.NC}"
-        )
-        print()
+        sys.stdout.write(_BANNER)
 
     def check_requirements(self) -> None:
         """Check that all required tools are installed."""
@@ -157,24 +228,34 @@ class RepositorySetup:
             capture_output=True,
             text=True,
         )
-        auth_info = result.stderr + result.stdout
+        # gh writes status to stderr on some versions and stdout on others;
+        # scan each buffer in place rather than concatenating them.
+        is_pat = any(
+            "github_pat_" in output or "gho_" in output
+            for output in (result.stderr, result.stdout)
+            if output
+        )
 
-        if "github_pat_" in auth_info or "gho_" in auth_info:
+        if is_pat:
             Logger.warning("You're using a Personal Access Token (PAT)")
-            print()
-            print(f"  {Colors.YELLOW}Required permissions for fine-grained PAT:{Colors.NC}")
-            print("  - Repository permissions:")
-            print("    • Administration: Read and write")
-            print("    • Contents: Read and write")
-            print("    • Metadata: Read")
-            print()
-            print(f"  {Colors.YELLOW}To create/update your PAT:{Colors.NC}")
-            print("  1. Go to: https://github.com/settings/tokens?type=beta")
-            print("  2. Create new token or edit existing")
-            print("  3. Select 'All repositories' or specific repos")
-            print("  4. Add the permissions listed above")
-            print("  5. Generate token and run: gh auth login")
-            print()
+            _write_lines(
+                [
+                    "",
+                    f"  {Colors.YELLOW}Required permissions for fine-grained PAT:{Colors.NC}",
+                    "  - Repository permissions:",
+                    "    • Administration: Read and write",
+                    "    • Contents: Read and write",
+                    "    • Metadata: Read",
+                    "",
+                    f"  {Colors.YELLOW}To create/update your PAT:{Colors.NC}",
+                    "  1. Go to: https://github.com/settings/tokens?type=beta",
+                    "  2. Create new token or edit existing",
+                    "  3. Select 'All repositories' or specific repos",
+                    "  4. Add the permissions listed above",
+                    "  5. Generate token and run: gh auth login",
+                    "",
+                ]
+            )
 
             if not prompt_confirm("Do you have the required permissions configured?", default=True):
                 Logger.error("Please configure your PAT with required permissions first")
@@ -229,13 +310,17 @@ class RepositorySetup:
         # Confirmation
         print()
         Logger.step("Configuration summary:")
-        print(f"  Repository: {self.config['repo_full']}")
-        print(f"  Visibility: {self.config['visibility']}")
-        print(f"  Package name: {self.config['package_name']}")
-        print(f"  PyPI name: {self.config['pypi_name']}")
-        print(f"  Description: {self.config['description']}")
-        print(f"  Author: {self.config['author_name']} <{self.config['author_email']}>")
-        print()
+        _write_lines(
+            [
+                f"  Repository: {self.config['repo_full']}",
+                f"  Visibility: {self.config['visibility']}",
+                f"  Package name: {self.config['package_name']}",
+                f"  PyPI name: {self.config['pypi_name']}",
+                f"  Description: {self.config['description']}",
+                f"  Author: {self.config['author_name']} <{self.config['author_email']}>",
+                "",
+            ]
+        )
 
         if not prompt_confirm("Proceed with these settings?", default=True):
             Logger.warning("Setup cancelled by user")
@@ -260,37 +345,40 @@ class RepositorySetup:
 
         except subprocess.CalledProcessError as e:
             Logger.error("Failed to create repository from template")
-            print()
+            lines = [""]
 
             # Always show the actual error message
             if e.stderr:
-                print(f"{Colors.RED}Error details:{Colors.NC}")
-                print(f"  {e.stderr.strip()}")
-                print()
+                lines += [f"{Colors.RED}Error details:{Colors.NC}", f"  {e.stderr.strip()}", ""]
 
             # Provide specific help for known errors
             if e.stderr and "Resource not accessible by personal access token" in e.stderr:
-                print(f"{Colors.YELLOW}Solution:{Colors.NC}")
-                print()
-                print(f"1. {Colors.CYAN}Re-authenticate with OAuth (recommended):{Colors.NC}")
-                print("   gh auth logout")
-                print("   gh auth login")
-                print("   # Choose: GitHub.com → HTTPS → Login with browser")
-                print()
-                print(f"2. {Colors.CYAN}Or update your fine-grained PAT:{Colors.NC}")
-                print("   https://github.com/settings/tokens?type=beta")
-                print("   Required permissions:")
-                print("   - Administration: Read and write")
-                print("   - Contents: Read and write")
-                print("   - Metadata: Read")
-                print()
+                lines += [
+                    f"{Colors.YELLOW}Solution:{Colors.NC}",
+                    "",
+                    f"1. {Colors.CYAN}Re-authenticate with OAuth (recommended):{Colors.NC}",
+                    "   gh auth logout",
+                    "   gh auth login",
+                    "   # Choose: GitHub.com → HTTPS → Login with browser",
+                    "",
+                    f"2. {Colors.CYAN}Or update your fine-grained PAT:{Colors.NC}",
+                    "   https://github.com/settings/tokens?type=beta",
+                    "   Required permissions:",
+                    "   - Administration: Read and write",
+                    "   - Contents: Read and write",
+                    "   - Metadata: Read",
+                    "",
+                ]
             elif e.stderr and "name already exists" in e.stderr.lower():
-                print(f"{Colors.YELLOW}Solution:{Colors.NC}")
-                print(f"  A repository named '{self.config['repo_name']}' already exists.")
-                print("  Choose a different name or delete the existing repository at:")
-                print(f"  https://github.com/{self.config['repo_full']}/settings")
-                print()
-
+                lines += [
+                    f"{Colors.YELLOW}Solution:{Colors.NC}",
+                    f"  A repository named '{self.config['repo_name']}' already exists.",
+                    "  Choose a different name or delete the existing repository at:",
+                    f"  https://github.com/{self.config['repo_full']}/settings",
+                    "",
+                ]
+
+            _write_lines(lines)
             sys.exit(1)
 
         # Wait a moment for repo to be fully ready
@@ -357,51 +445,52 @@ class RepositorySetup:
                 "your.email@example.com": self.config["author_email"],
             }
 
-            # Update main configuration files (using shared constant from utils.py)
-            for file_path in FILES_TO_UPDATE:
-                path = Path(file_path)
-                if path.exists():
-                    update_file(path, replacements)
-
-            # Update documentation files
-            docs_dir = Path("docs")
-            if docs_dir.exists():
-                for doc_file in docs_dir.rglob("*.md"):
-                    update_file(doc_file, replacements)
+            # Remove template-only tests (they're only for the template itself)
+            template_tests_dir = Path("tests/template")
+            if template_tests_dir.exists():
+                shutil.rmtree(template_tests_dir)
+                Logger.info("Removed template-only tests (tests/template/)")
 
             # Update test files (limited replacements to preserve test data)
             tests_dir = Path("tests")
             if tests_dir.exists():
                 update_test_files(tests_dir, self.config["package_name"])
 
-            # Remove template-only tests (they're only for the template itself)
-            template_tests_dir = Path("tests/template")
-            if template_tests_dir.exists():
-                shutil.rmtree(template_tests_dir)
-                Logger.info("Removed template-only tests (tests/template/)")
+            # Collect every file that gets the full replacement set; a dict
+            # keeps discovery order and drops duplicates.
+            files: dict[Path, None] = {}
+
+            # Main configuration files (using shared constant from utils.py)
+            for file_path in FILES_TO_UPDATE:
+                path = Path(file_path)
+                if path.exists():
+                    files[path] = None
 
-            # Update source files
+            # Documentation files
+            docs_dir = Path("docs")
+            if docs_dir.exists():
+                files.update(dict.fromkeys(docs_dir.rglob("*.md")))
+
+            # Source files
             src_dir = Path("src")
             if src_dir.exists():
-                for src_file in src_dir.rglob("*.py"):
-                    update_file(src_file, replacements)
+                files.update(dict.fromkeys(src_dir.rglob("*.py")))
 
-            # Update issue templates
+            # Issue templates
             issue_templates_dir = Path(".github/ISSUE_TEMPLATE")
             if issue_templates_dir.exists():
-                for template_file in issue_templates_dir.glob("*.md"):
-                    update_file(template_file, replacements)
+                files.update(dict.fromkeys(issue_templates_dir.glob("*.md")))
                 # Also update config.yml if it exists
                 config_file = issue_templates_dir / "config.yml"
                 if config_file.exists():
-                    update_file(config_file, replacements)
+                    files[config_file] = None
 
-            # Update example files
+            # Example files
             examples_dir = Path("examples")
             if examples_dir.exists():
-                for example_file in examples_dir.rglob("*"):
-                    if example_file.is_file():
-                        update_file(example_file, replacements)
+                files.update(dict.fromkeys(p for p in examples_dir.rglob("*") if p.is_file()))
+
+            _update_files(list(files), replacements, serial=self.serial)
 
             # Rename package directory
             old_package_dir = Path("src/package_name")
@@ -753,48 +842,84 @@ To reinstall the template-sync suite later, run:
         """Enable GitHub Pages."""
         _enable_github_pages(repo_full=self.config["repo_full"])
 
+    def configure_github_settings(self) -> None:
+        """Apply repository settings, rulesets, labels and GitHub Pages.
+
+        Repository settings are applied first, on their own: the PATCH can
+        change visibility, which decides whether rulesets and Pages are
+        available on a Free-plan repository. The remaining three steps touch
+        independent resources and are bound by GitHub API latency, so they
+        run concurrently unless ``serial`` is set. Their output is buffered
+        and replayed in step order, so the log reads exactly as it would for
+        a serial run. Every step has already run by the time the output is
+        replayed, so all of it is replayed, including output from steps after
+        a failing one, before the first step's exception is re-raised.
+        """
+        self.configure_repository_settings()
+
+        steps = [
+            self.configure_branch_protection,
+            self.replicate_labels,
+            self.enable_github_pages,
+        ]
+        if self.serial:
+            for step in steps:
+                step()
+            return
+
+        stdout, stderr = sys.stdout, sys.stderr
+        sys.stdout, sys.stderr = _ThreadBufferedStream(stdout), _ThreadBufferedStream(stderr)
+        try:
+            with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+                futures = [executor.submit(_run_buffered, step) for step in steps]
+        finally:
+            sys.stdout, sys.stderr = stdout, stderr
+
+        first_error: BaseException | None = None
+        for future in futures:
+            records, error = future.result()
+            for stream, text in records:
+                stream.write(text)
+            if first_error is None:
+                first_error = error
+        if first_error is not None:
+            raise first_error
+
     def print_manual_steps(self) -> None:
         """Print manual steps that need to be completed."""
-        print()
-        print(
-            f"{Colors.CYAN}╔═══════════════════════════════════════════════════════════╗{Colors.NC}"
-        )
-        print(
-            f"{Colors.CYAN}║                  Setup Complete! 🎉                       ║{Colors.NC}"
-        )
-        print(
-            f"{Colors.CYAN}╚═══════════════════════════════════════════════════════════╝{Colors.NC}"
-        )
-        print()
-        Logger.success(
-            f"Repository created and configured: https://github.com/{self.config['repo_full']}"
-        )
+        repo_full = self.config["repo_full"]
+        repo_name = self.config["repo_name"]
+        todo = f"  {Colors.YELLOW}[ ]{Colors.NC}"
+        done = f"  {Colors.GREEN}✓{Colors.NC}"
+
+        sys.stdout.write(_COMPLETE_BANNER)
+        Logger.success(f"Repository created and configured: https://github.com/{repo_full}")
         print()
 
         Logger.step("Manual steps required:")
-        print()
-        print(f"  {Colors.YELLOW}[ ]{Colors.NC} Add PyPI token to repository secrets:")
-        print(f"      gh secret set PYPI_TOKEN --repo {self.config['repo_full']}")
-        print()
-        print(
-            f"  {Colors.YELLOW}[ ]{Colors.NC} Add TestPyPI token to repository secrets (optional):"
-        )
-        print(f"      gh secret set TEST_PYPI_TOKEN --repo {self.config['repo_full']}")
-        print()
-        print(
-            f"  {Colors.YELLOW}[ ]{Colors.NC} Add Codecov token to repository secrets (optional):"
+        _write_lines(
+            [
+                "",
+                f"{todo} Add PyPI token to repository secrets:",
+                f"      gh secret set PYPI_TOKEN --repo {repo_full}",
+                "",
+                f"{todo} Add TestPyPI token to repository secrets (optional):",
+                f"      gh secret set TEST_PYPI_TOKEN --repo {repo_full}",
+                "",
+                f"{todo} Add Codecov token to repository secrets (optional):",
+                f"      gh secret set CODECOV_TOKEN --repo {repo_full}",
+                "",
+                f"{todo} Review and adjust repository settings:",
+                f"      https://github.com/{repo_full}/settings",
+                "",
+                f"{todo} Review branch protection rulesets:",
+                f"      https://github.com/{repo_full}/settings/rules",
+                "",
+                f"{todo} Invite collaborators (if needed):",
+                f"      https://github.com/{repo_full}/settings/access",
+                "",
+            ]
         )
-        print(f"      gh secret set CODECOV_TOKEN --repo {self.config['repo_full']}")
-        print()
-        print(f"  {Colors.YELLOW}[ ]{Colors.NC} Review and adjust repository settings:")
-        print(f"      https://github.com/{self.config['repo_full']}/settings")
-        print()
-        print(f"  {Colors.YELLOW}[ ]{Colors.NC} Review branch protection rulesets:")
-        print(f"      https://github.com/{self.config['repo_full']}/settings/rules")
-        print()
-        print(f"  {Colors.YELLOW}[ ]{Colors.NC} Invite collaborators (if needed):")
-        print(f"      https://github.com/{self.config['repo_full']}/settings/access")
-        print()
 
         Logger.info(
             "Template tooling was auto-removed. To reinstall the template-sync "
@@ -805,20 +930,22 @@ To reinstall the template-sync suite later, run:
         print()
 
         Logger.step("You're all set!")
-        print()
-        repo_path = os.path.join(self.start_dir, self.config["repo_name"])
-        print(f"  {Colors.GREEN}✓{Colors.NC} Repository cloned to: {repo_path}")
-        print(f"  {Colors.GREEN}✓{Colors.NC} Dependencies installed")
-        print(f"  {Colors.GREEN}✓{Colors.NC} Pre-commit hooks configured")
-        print(f"  {Colors.GREEN}✓{Colors.NC} Code formatted and validated")
-        print()
-        print("  Navigate to your repository and start developing:")
-        print(f"     cd {self.config['repo_name']}")
-        print()
-
-        Logger.info(
-            f"Documentation: https://github.com/{self.config['repo_full']}/blob/main/README.md"
+        repo_path = os.path.join(self.start_dir, repo_name)
+        _write_lines(
+            [
+                "",
+                f"{done} Repository cloned to: {repo_path}",
+                f"{done} Dependencies installed",
+                f"{done} Pre-commit hooks configured",
+                f"{done} Code formatted and validated",
+                "",
+                "  Navigate to your repository and start developing:",
+                f"     cd {repo_name}",
+                "",
+            ]
         )
+
+        Logger.info(f"Documentation: https://github.com/{repo_full}/blob/main/README.md")
         print()
 
     def run(self) -> None:
@@ -842,10 +969,7 @@ To reinstall the template-sync suite later, run:
         # .github/workflows/codeql.yml workflow that the template generator
         # copies into the new repo automatically.
         self.create_github_repository()
-        self.configure_repository_settings()
-        self.configure_branch_protection()
-        self.replicate_labels()
-        self.enable_github_pages()
+        self.configure_github_settings()
 
         # Now clone and configure locally
         self.clone_repository()
@@ -866,10 +990,14 @@ To reinstall the template-sync suite later, run:
         self.print_manual_steps()
 
 
-def main() -> None:
-    """Main entry point."""
+def main(serial: bool = False) -> None:
+    """Main entry point.
+
+    Args:
+        serial: Run the GitHub configuration steps one at a time.
+    """
     try:
-        setup = RepositorySetup()
+        setup = RepositorySetup(serial=serial)
         setup.run()
     except KeyboardInterrupt:
         print()
@@ -878,16 +1006,21 @@ def main() -> None:
     except Exception as e:
         print()
         Logger.error(f"Setup failed with unexpected error: {e}")
-        print()
-        print("This is likely a bug in the setup script.")
-        print("Please report this issue with the error details above at:")
-        print("  https://github.com/endavis/pyproject-template/issues")
-        print()
+        _write_lines(
+            [
+                "",
+                "This is likely a bug in the setup script.",
+                "Please report this issue with the error details above at:",
+                "  https://github.com/endavis/pyproject-template/issues",
+                "",
+                "Full traceback:",
+            ]
+        )
+        sys.stdout.flush()
 
-        # Show traceback for debugging
+        # Show traceback for debugging (on stderr, after the report above)
         import traceback
 
-        print("Full traceback:")
         traceback.print_exc()
         sys.exit(1)
 